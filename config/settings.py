@@ -9,5 +9,14 @@ class Settings:
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 10))
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
     SUMMARY_MAX_LENGTH = int(os.getenv("SUMMARY_MAX_LENGTH", 500))
+    MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", 10))
+    SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", 20))
+    OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", 3500))
+    OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", 90000))
+    SUMMARY_CACHE_FILE = os.getenv("SUMMARY_CACHE_FILE", ".summary_cache.sqlite3")
+    SCRAPE_CACHE_FILE = os.getenv("SCRAPE_CACHE_FILE", ".scrape_cache.sqlite3")
+    SEMANTIC_CACHE_DIR = os.getenv("SEMANTIC_CACHE_DIR", ".semantic_cache")
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.92))
+    RESPONDED_MENTIONS_FILE = os.getenv("RESPONDED_MENTIONS_FILE", "responded_mentions.json")
 
 settings = Settings()
@@ -747,6 +747,43 @@ class B2BVaultAgent:
         
         return processed_articles
 
+    def process_multiple_articles_pipelined(self, articles: List[Dict], preview: bool = False) -> List[Dict]:
+        """Process articles as a scrape -> analyze pipeline so page loads overlap Perplexity calls."""
+        workers = max(1, min(self.max_workers, 5))
+        self.logger.info(f"Starting pipelined processing of {len(articles)} articles with {workers} workers per stage")
+        if preview:
+            print(f"\n🔄 Processing {len(articles)} articles (scraping overlaps analysis)...")
+
+        pending = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as scrape_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=workers) as api_pool:
+            # Scraped contents arrive in article order; each is handed to the
+            # analysis pool as soon as it is ready while scraping continues
+            contents = scrape_pool.map(lambda article: self.scrape_article_content(article['url'], preview=False), articles)
+            for article, content in zip(articles, contents):
+                if not content:
+                    self.logger.warning(f"Failed to scrape content for: {article['title']}")
+                    continue
+                pending.append((article, content, api_pool.submit(self.send_to_perplexity, content, preview=False)))
+
+            processed_articles = []
+            for article, content, future in pending:
+                try:
+                    processed_articles.append({
+                        **article,
+                        'content': content,
+                        'summary': future.result()
+                    })
+                    if preview:
+                        print(f"   ✅ Processed: {article['title'][:60]}")
+                except Exception as e:
+                    self.logger.error(f"Error processing article '{article['title']}': {e}")
+                    if preview:
+                        print(f"   ❌ Error processing article: {e}")
+
+        self.logger.info(f"Pipelined processing complete: {len(processed_articles)}/{len(articles)} articles processed")
+        return processed_articles
+
     def generate_comprehensive_pdf_report(self, processed_articles: List[Dict], preview: bool = False):
         """Generate a comprehensive PDF report with all processed articles."""
         self.logger.info("Generating comprehensive PDF report")
@@ -0,0 +1,138 @@
+"""asyncio Slack client for mention scanning, built on slack_sdk's AsyncWebClient."""
+import asyncio
+import logging
+import time
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.web.async_client import AsyncWebClient
+from config.settings import settings
+from src.slack_client import SlackClient, _SSL_CONTEXT
+
+logger = logging.getLogger(__name__)
+
+# Slack requests allowed in flight at once across all conversations
+MAX_CONCURRENT_REQUESTS = 10
+
+class AsyncSlackClient:
+    """Scans conversations concurrently on one event loop.
+
+    Slack reads go through AsyncWebClient; responding (scraping and
+    summarizing) reuses SlackClient's synchronous pipeline in a worker thread,
+    so mention bookkeeping and reply formatting stay in one place.
+    """
+
+    def __init__(self, sync_client=None, max_concurrency=MAX_CONCURRENT_REQUESTS):
+        """Initialize the async client, sharing state with a SlackClient"""
+        self.client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN, ssl=_SSL_CONTEXT)
+        self.client.retry_handlers.append(AsyncRateLimitErrorRetryHandler(max_retry_count=3))
+        self.sync_client = sync_client or SlackClient()
+        self.channel_id = settings.SLACK_CHANNEL_ID
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_channel_messages(self, start_date=None, end_date=None, limit=None, channel_id=None, oldest_ts=None):
+        """Fetch messages from a Slack channel (defaults to the configured channel)
+
+        Same arguments and defaults as SlackClient.get_channel_messages.
+        """
+        channel_id = channel_id or self.channel_id
+        oldest = start_date.timestamp() if start_date else oldest_ts
+        latest = end_date.timestamp() if end_date else None
+
+        # If no dates provided, get messages from last 7 days
+        if not oldest and not latest:
+            oldest = time.time() - 7 * 24 * 3600
+
+        messages = []
+        cursor = None
+        while True:
+            async with self._semaphore:
+                response = await self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=oldest,
+                    latest=latest,
+                    limit=min(limit or 200, 200),  # Slack API limit is 200
+                    cursor=cursor
+                )
+            messages.extend(response.get('messages', []))
+
+            # Stop paging as soon as we have enough
+            if limit and len(messages) >= limit:
+                return messages[:limit]
+
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                return messages
+
+    async def _scan_channel(self, conversation, bot_user_id, oldest_ts, limit):
+        """Fetch recent messages from one conversation and return those mentioning the bot"""
+        is_dm = conversation.get('is_dm', False)
+
+        # Smaller limit for multi-conversation scans, smaller still for DMs
+        conversation_limit = min(limit, 10 if is_dm else 20)
+        messages = await self.get_channel_messages(
+            oldest_ts=oldest_ts,
+            limit=conversation_limit,
+            channel_id=conversation['id']
+        )
+
+        return [message for message in messages if self.sync_client._is_new_mention(message, bot_user_id)]
+
+    async def respond_to_mention(self, message, bot_user_id=None, channel_id=None):
+        """Respond to a mention without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.sync_client.respond_to_mention, message, bot_user_id, channel_id=channel_id
+        )
+
+    async def check_all_channels_for_mentions(self, limit=50, start_date=None):
+        """Check all accessible channels and DMs for mentions and respond"""
+        sync_client = self.sync_client
+        try:
+            # Identity and channel list are cached on the sync client
+            bot_user_id = await asyncio.to_thread(sync_client.get_bot_user_id)
+            if not bot_user_id:
+                logger.error("Could not get bot user ID")
+                return 0
+
+            channels = await asyncio.to_thread(sync_client.get_all_channels)
+            all_conversations = sync_client._select_conversations(channels)
+
+            # Get recent messages (default to last 2 hours to catch mentions)
+            oldest_ts = start_date.timestamp() if start_date else time.time() - 2 * 3600
+
+            results = await asyncio.gather(
+                *(self._scan_channel(conversation, bot_user_id, oldest_ts, limit)
+                  for conversation in all_conversations),
+                return_exceptions=True
+            )
+
+            total_mentions_processed = 0
+            for conversation, mentions in zip(all_conversations, results):
+                conv_name = sync_client._conversation_name(conversation)
+
+                if isinstance(mentions, SlackApiError):
+                    error_code = mentions.response.get('error', 'unknown')
+                    if error_code == 'not_in_channel':
+                        logger.debug(f"Bot not in {conv_name}, skipping...")
+                    else:
+                        logger.warning(f"Slack API error in {conv_name}: {error_code}")
+                    continue
+                if isinstance(mentions, Exception):
+                    logger.error(f"Error checking {conv_name}: {str(mentions)}")
+                    continue
+
+                conv_mentions = await asyncio.to_thread(
+                    sync_client._respond_to_new_mentions,
+                    mentions, bot_user_id, channel_id=conversation['id'], where=conv_name
+                )
+                total_mentions_processed += conv_mentions
+
+                if conv_mentions > 0:
+                    logger.info(f"Processed {conv_mentions} mentions in {conv_name}")
+
+            sync_client._save_responded()
+            logger.info(f"Total mentions processed across {len(all_conversations)} conversations: {total_mentions_processed}")
+            return total_mentions_processed
+
+        except Exception as e:
+            logger.error(f"Error checking all channels for mentions: {str(e)}")
+            return 0
@@ -0,0 +1,140 @@
+"""asyncio web scraper for large batches, built on aiohttp."""
+import asyncio
+import logging
+import aiohttp
+from config.settings import settings
+from src.web_scraper import READ_CHUNK_BYTES, RETRY_STATUS_CODES, WebScraper
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open across all hosts, and per host so one site isn't hammered
+MAX_CONNECTIONS = 100
+LIMIT_PER_HOST = 2
+
+class AsyncWebScraper:
+    """Fetches pages concurrently on one event loop.
+
+    Only the network I/O is async; header selection and HTML parsing reuse
+    WebScraper's methods (parsing runs in a worker thread), so results are
+    identical to WebScraper.scrape_url.
+    """
+
+    def __init__(self, sync_scraper=None, max_concurrency=None, limit_per_host=LIMIT_PER_HOST):
+        """Initialize the async scraper, sharing configuration with a WebScraper"""
+        self.sync_scraper = sync_scraper or WebScraper()
+        self.max_concurrency = max_concurrency or settings.SCRAPE_WORKERS
+        self.limit_per_host = limit_per_host
+        self.timeout = self.sync_scraper.timeout
+        self.max_retries = self.sync_scraper.max_retries
+
+    def _client_session(self):
+        """New aiohttp session with the scraper's default headers and pool limits"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=self.limit_per_host),
+            headers=dict(self.sync_scraper.session.headers),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def _fetch_with_retry(self, session, url, extra_headers=None, conditional_headers=None):
+        """Fetch an HTML page as (body, response headers), or None if every attempt fails or it isn't HTML
+
+        Follows WebScraper's policy: connection errors and transient statuses
+        are retried up to max_retries attempts, other HTTP errors fail at once
+        except on blocking-prone sites, and the body goes through the same
+        content-type check and MAX_PAGE_BYTES cap. With conditional_headers,
+        a 304 Not Modified reply gives a None body.
+        """
+        needs_anti_blocking = self.sync_scraper._needs_anti_blocking(url)
+
+        for attempt in range(self.max_retries):
+            try:
+                # Use enhanced headers for blocking-prone sites
+                headers = self.sync_scraper._get_enhanced_headers(url, attempt) if needs_anti_blocking else extra_headers
+                if conditional_headers:
+                    headers = {**(headers or {}), **conditional_headers}
+                async with session.get(url, headers=headers) as response:
+                    response.raise_for_status()
+                    if response.status == 304:
+                        return None, response.headers
+                    body = await self._read_html_body(url, response)
+                    return (body, response.headers) if body else None
+
+            except aiohttp.ClientResponseError as e:
+                # As in WebScraper: transient statuses are retried, while other
+                # refusals (404, 403, ...) are retried with fresh headers only
+                # for blocking-prone sites
+                retryable = needs_anti_blocking or e.status in RETRY_STATUS_CODES
+                error = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retryable = True
+                error = e
+
+            logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(error)}")
+            if not retryable or attempt == self.max_retries - 1:
+                break
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+        logger.error(f"Failed to fetch {url}")
+        return None
+
+    async def _read_html_body(self, url, response):
+        """Read a response's body in chunks, skipping non-HTML and stopping at MAX_PAGE_BYTES"""
+        scraper = self.sync_scraper
+        if not scraper._is_html_response(url, response.headers):
+            return None
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            if scraper._add_capped_chunk(url, body, chunk):
+                break
+        return bytes(body)
+
+    async def scrape_url(self, url, session=None):
+        """Scrape content from a single URL (opens a session if none is given)"""
+        if session is None:
+            async with self._client_session() as session:
+                return await self.scrape_url(url, session)
+
+        scraper = self.sync_scraper
+        try:
+            # The cache is SQLite on local disk; lookups are quick enough to run inline
+            cached = scraper.cache.get(url) if scraper.cache else None
+            if cached and cached['fresh']:
+                logger.info(f"Using cached scrape for {url}")
+                return {**cached['result'], 'url': url}
+
+            logger.info(f"Scraping URL: {url}")
+
+            fetched = await self._fetch_with_retry(
+                session, url, scraper._site_headers(url), scraper._conditional_headers(cached)
+            )
+            if fetched is None:
+                return None
+
+            content, response_headers = fetched
+            if content is None:
+                logger.info(f"{url} unchanged since last scrape")
+                scraper.cache.touch(url)
+                return {**cached['result'], 'url': url}
+
+            # Parsing is CPU-bound; keep it off the event loop
+            result = await asyncio.to_thread(scraper._parse_page, url, content)
+            return scraper._store_result(url, result, response_headers)
+
+        except Exception as e:
+            return scraper._error_result(url, e)
+
+    async def batch_scrape(self, urls):
+        """Scrape multiple URLs concurrently, returning results in input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Each page is scraped once, however often it was shared
+        urls = list(dict.fromkeys(urls))
+
+        async def bounded_scrape(url, session):
+            async with semaphore:
+                return await self.scrape_url(url, session)
+
+        async with self._client_session() as session:
+            results = await asyncio.gather(*(bounded_scrape(url, session) for url in urls))
+
+        return [result for result in results if result]
@@ -8,6 +8,7 @@ from src.summarizer import Summarizer
 from src.google_drive_client import GoogleDriveClient
 from src.pdf_generator import create_pdf_report
 from src.content_formatter import ContentFormatter  # Add this import
+from src.utils import ts_to_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +90,7 @@ class LinkProcessor:
                     'domain': self._extract_domain(url),
                     'slack_user': user_display_name,
                     'slack_user_id': user_id,
-                    'slack_timestamp': slack_data['timestamp'].isoformat() if slack_data.get('timestamp') else None,
+                    'slack_timestamp': ts_to_datetime(slack_data['ts_float']).isoformat() if slack_data.get('ts_float') else None,
                     'slack_channel': slack_data.get('channel'),
                     
                     # Content type classification and formatting
@@ -1,22 +1,82 @@
 """Slack client for interacting with Slack API, handling messages, mentions, and file uploads."""
+import json
 import logging
+import queue
+import re
+import ssl
+import threading
 import time
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from config.settings import settings
-from src.utils import extract_urls_from_text
+from src.summarizer import Summarizer
+from src.summary_organizer import create_shared_summary_folder, create_summary_digest
+from src.utils import extract_urls_from_text, save_summary_to_file
+from src.web_scraper import WebScraper
 
 logger = logging.getLogger(__name__)
 
+# Slack renders labelled links as <url|label>; keep only the URL part
+_SLACK_LINK_LABEL_RE = re.compile(r'<(https?://[^|>\s]+)\|[^>]*>')
+
+# Shared TLS context for every Slack call. slack_sdk's urllib transport has no
+# connection pool, but without an explicit context it rebuilds one (reloading
+# the CA bundle) for every request.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Number of responded mention timestamps remembered across scan passes
+MAX_RESPONDED_MENTIONS = 10_000
+
+# Every way of addressing the bot in one pass: a <@USERID> tag (compared against
+# the bot's ID) or one of the name variants @ailinkscraper, @ai-link scraper,
+# @ai-link-scraper, @ailink scraper, @ailink-scraper (any case)
+_MENTION_RE = re.compile(
+    r"<@([UW][A-Z0-9]+)(?:\|[^>]*)?>|@(?:ailinkscraper|ai-link[- ]scraper|ailink[- ]scraper)",
+    re.IGNORECASE
+)
+
+# How long channel metadata is reused before asking Slack again (seconds)
+CHANNEL_INFO_TTL = 300
+
+# Conversations scanned in parallel by check_all_channels_for_mentions
+MAX_SCAN_WORKERS = 8
+
+# URLs from a single mention scraped and summarized in parallel
+MAX_URL_WORKERS = 8
+
+# Summaries kept in memory so a link mentioned again isn't re-scraped
+MAX_CACHED_URL_SUMMARIES = 512
+
 class SlackClient:
     def __init__(self):
         """Initialize Slack client with bot token"""
-        self.client = WebClient(token=settings.SLACK_BOT_TOKEN)
+        self.client = WebClient(token=settings.SLACK_BOT_TOKEN, ssl=_SSL_CONTEXT)
+        # Let the SDK wait out 429s (honouring Retry-After) instead of sleeping between pages
+        self.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
         self.channel_id = settings.SLACK_CHANNEL_ID
         # Cache for user info to avoid repeated API calls
         self._user_cache = {}
+        # Bot identity and channel metadata, cached to avoid repeat round trips
+        self._auth = None
+        self._channel_info_cache = {}
+        self._all_channels_cache = None
+        # Recent per-URL summaries, shared across mentions (guarded by a lock
+        # because URL workers run in parallel)
+        self._url_summary_cache = OrderedDict()
+        self._url_summary_lock = threading.Lock()
+        self._scraper = None
+        # Timestamps of mentions already answered, so repeated scans don't re-respond
+        self._responded_file = settings.RESPONDED_MENTIONS_FILE
+        self._responded = self._load_responded()
+        # Background sender so summarization can continue while posts are in flight
+        self._send_q = queue.Queue()
+        self._sender = threading.Thread(target=self._send_worker, daemon=True)
+        self._sender.start()
         
     def get_user_info(self, user_id):
         """Get user information by user ID, with caching"""
@@ -51,6 +111,32 @@ class SlackClient:
             self._user_cache[user_id] = fallback_data
             return fallback_data
     
+    def _load_responded(self):
+        """Load the set of already-answered mention timestamps from disk"""
+        try:
+            with open(self._responded_file, 'r', encoding='utf-8') as f:
+                return OrderedDict.fromkeys(json.load(f), True)
+        except FileNotFoundError:
+            return OrderedDict()
+        except Exception as e:
+            logger.warning(f"Could not load responded mentions from {self._responded_file}: {e}")
+            return OrderedDict()
+    
+    def _save_responded(self):
+        """Persist answered mention timestamps so restarts don't re-fire"""
+        try:
+            with open(self._responded_file, 'w', encoding='utf-8') as f:
+                json.dump(list(self._responded), f)
+        except Exception as e:
+            logger.warning(f"Could not save responded mentions to {self._responded_file}: {e}")
+    
+    def _mark_responded(self, ts):
+        """Record a mention as answered, evicting the oldest entries past the cap"""
+        self._responded[ts] = True
+        self._responded.move_to_end(ts)
+        while len(self._responded) > MAX_RESPONDED_MENTIONS:
+            self._responded.popitem(last=False)
+    
     def get_user_display_name(self, user_id):
         """Get the best available display name for a user"""
         if not user_id:
@@ -75,11 +161,15 @@ class SlackClient:
             
         return user_id
     
-    def get_channel_messages(self, start_date=None, end_date=None, limit=None):
-        """Fetch messages from the specified Slack channel"""
+    def get_channel_messages(self, start_date=None, end_date=None, limit=None, channel_id=None, oldest_ts=None):
+        """Fetch messages from the specified Slack channel (defaults to the configured channel)
+        
+        oldest_ts is an epoch timestamp that can be passed instead of start_date.
+        """
+        channel_id = channel_id or self.channel_id
         try:
             # Convert dates to timestamps if provided
-            oldest = None
+            oldest = oldest_ts
             latest = None
             
             if start_date:
@@ -89,40 +179,28 @@ class SlackClient:
             
             # If no dates provided, get messages from last 7 days
             if not oldest and not latest:
-                week_ago = datetime.now() - timedelta(days=7)
-                oldest = week_ago.timestamp()
+                oldest = time.time() - 7 * 24 * 3600
             
-            logger.info(f"Fetching messages from channel {self.channel_id}")
+            logger.info(f"Fetching messages from channel {channel_id}")
             
             messages = []
-            cursor = None
             
-            while True:
-                try:
-                    response = self.client.conversations_history(
-                        channel=self.channel_id,
-                        oldest=oldest,
-                        latest=latest,
-                        limit=min(limit or 200, 200),  # Slack API limit is 200
-                        cursor=cursor
-                    )
-                    
-                    batch_messages = response.get('messages', [])
+            try:
+                for batch_messages in self._iter_history_pages(
+                    channel_id,
+                    oldest=oldest,
+                    latest=latest,
+                    page_size=min(limit or 200, 200)  # Slack API limit is 200
+                ):
                     messages.extend(batch_messages)
-                    
                     logger.info(f"Retrieved {len(batch_messages)} messages")
                     
-                    # Check if we have more messages to fetch
-                    cursor = response.get('response_metadata', {}).get('next_cursor')
-                    if not cursor or (limit and len(messages) >= limit):
+                    # Stop paging as soon as we have enough
+                    if limit and len(messages) >= limit:
                         break
                         
-                    # Respect rate limits
-                    time.sleep(1)
-                    
-                except SlackApiError as e:
-                    logger.error(f"Error fetching messages: {e.response['error']}")
-                    break
+            except SlackApiError as e:
+                logger.error(f"Error fetching messages: {e.response['error']}")
             
             if limit:
                 messages = messages[:limit]
@@ -134,27 +212,57 @@ class SlackClient:
             logger.error(f"Error in get_channel_messages: {str(e)}")
             return []
     
-    def extract_links_from_messages(self, messages):
-        """Extract all URLs from Slack messages, including threaded replies and message blocks"""
-        links_data = []
-        
+    def _iter_history_pages(self, channel_id, oldest=None, latest=None, page_size=200):
+        """Yield pages of channel history, fetching the next page only when asked"""
+        cursor = None
+        while True:
+            response = self.client.conversations_history(
+                channel=channel_id,
+                oldest=oldest,
+                latest=latest,
+                limit=page_size,
+                cursor=cursor
+            )
+            yield response.get('messages', [])
+            
+            # Check if we have more messages to fetch
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                return
+    
+    def iter_links_from_messages(self, messages):
+        """Yield link data for every URL in Slack messages, including threaded replies and message blocks"""
         for message in messages:
             # Skip bot messages
             if message.get('bot_id'):
                 continue
             
             # Extract URLs from this message
-            message_links = self._extract_urls_from_single_message(message)
-            links_data.extend(message_links)
+            yield from self._extract_urls_from_single_message(message)
             
             # Check for threaded replies
             if message.get('reply_count', 0) > 0:
-                thread_links = self._extract_links_from_thread(message.get('ts'))
-                links_data.extend(thread_links)
+                yield from self._extract_links_from_thread(message.get('ts'))
+    
+    def extract_links_from_messages(self, messages):
+        """Extract all URLs from Slack messages, including threaded replies and message blocks"""
+        links_data = list(self.iter_links_from_messages(messages))
         
         logger.info(f"Extracted {len(links_data)} links from {len(messages)} messages (including threads)")
         return links_data
 
+    def _extract_urls(self, text):
+        """Extract URLs from Slack message text
+        
+        Skips the regex work when no link can be present, and unwraps
+        <url|label> markup so the label doesn't end up in the URL.
+        """
+        if not text or 'http' not in text:
+            return []
+        if '|' in text:
+            text = _SLACK_LINK_LABEL_RE.sub(r'<\1>', text)
+        return extract_urls_from_text(text)
+    
     def _extract_urls_from_single_message(self, message):
         """Extract URLs from a single message, checking text, blocks, and attachments"""
         urls = []
@@ -163,7 +271,7 @@ class SlackClient:
         # Extract from main text field
         if message.get('text'):
             message_text = message.get('text', '')
-            urls.extend(extract_urls_from_text(message_text))
+            urls.extend(self._extract_urls(message_text))
         
         # Extract from message blocks (modern Slack messages)
         if message.get('blocks'):
@@ -171,7 +279,7 @@ class SlackClient:
                 block_text = self._extract_text_from_block(block)
                 if block_text:
                     message_text += " " + block_text
-                    urls.extend(extract_urls_from_text(block_text))
+                    urls.extend(self._extract_urls(block_text))
         
         # Extract from attachments
         if message.get('attachments'):
@@ -181,7 +289,7 @@ class SlackClient:
                     if attachment.get(field):
                         attachment_text = attachment.get(field)
                         message_text += " " + attachment_text
-                        urls.extend(extract_urls_from_text(attachment_text))
+                        urls.extend(self._extract_urls(attachment_text))
                 
                 # Check attachment fields array
                 if attachment.get('fields'):
@@ -189,7 +297,7 @@ class SlackClient:
                         if field.get('value'):
                             field_text = field.get('value')
                             message_text += " " + field_text
-                            urls.extend(extract_urls_from_text(field_text))
+                            urls.extend(self._extract_urls(field_text))
         
         # Remove duplicates while preserving order
         unique_urls = []
@@ -199,15 +307,18 @@ class SlackClient:
                 seen.add(url)
                 unique_urls.append(url)
         
-        # Create link data for each unique URL
+        # Create link data for each unique URL. The timestamp is kept as a float;
+        # use ts_to_datetime() where a datetime is actually needed.
+        ts_float = float(message.get('ts', 0))
+        message_text = message_text.strip()
         links_data = []
         for url in unique_urls:
             link_data = {
                 'url': url,
                 'slack_message_id': message.get('ts'),
-                'message_text': message_text.strip(),
+                'message_text': message_text,
                 'user': message.get('user'),
-                'timestamp': datetime.fromtimestamp(float(message.get('ts', 0))),
+                'ts_float': ts_float,
                 'is_thread_reply': False
             }
             links_data.append(link_data)
@@ -269,29 +380,48 @@ class SlackClient:
             return []
     
     def get_channel_info(self):
-        """Get information about the channel"""
+        """Get information about the channel, reusing recent results"""
+        cached = self._channel_info_cache.get(self.channel_id)
+        if cached and time.monotonic() - cached[0] < CHANNEL_INFO_TTL:
+            return cached[1]
+        
         try:
             response = self.client.conversations_info(channel=self.channel_id)
-            return response.get('channel', {})
+            channel_info = response.get('channel', {})
+            self._channel_info_cache[self.channel_id] = (time.monotonic(), channel_info)
+            return channel_info
         except SlackApiError as e:
             logger.error(f"Error getting channel info: {e.response['error']}")
             return {}
     
+    def _get_auth(self):
+        """Return the auth_test result, calling Slack only the first time
+        
+        The cached result is dropped if the call fails, so the next caller retries.
+        """
+        if self._auth is None:
+            try:
+                self._auth = self.client.auth_test().data
+            except SlackApiError:
+                self._auth = None
+                raise
+        return self._auth
+    
     def test_connection(self):
         """Test the Slack API connection"""
         try:
-            response = self.client.auth_test()
-            logger.info(f"Connected to Slack as: {response.get('user')}")
+            auth = self._get_auth()
+            logger.info(f"Connected to Slack as: {auth.get('user')}")
             return True
         except SlackApiError as e:
             logger.error(f"Slack connection failed: {e.response['error']}")
             return False
     
-    def send_message(self, text, thread_ts=None):
-        """Send a message to the channel"""
+    def send_message(self, text, thread_ts=None, channel_id=None):
+        """Send a message to the channel (defaults to the configured channel)"""
         try:
             response = self.client.chat_postMessage(
-                channel=self.channel_id,
+                channel=channel_id or self.channel_id,
                 text=text,
                 thread_ts=thread_ts
             )
@@ -301,8 +431,38 @@ class SlackClient:
             logger.error(f"Error sending message: {e.response['error']}")
             return None
     
-    def send_summary_to_channel(self, summary_data, reply_to_message=True):
-        """Send a formatted summary back to the Slack channel"""
+    def queue_message(self, text, thread_ts=None, channel_id=None):
+        """Queue a message for the background sender without waiting on the API"""
+        self._send_q.put({
+            'channel': channel_id or self.channel_id,
+            'text': text,
+            'thread_ts': thread_ts
+        })
+    
+    def flush(self):
+        """Block until all queued messages have been sent"""
+        self._send_q.join()
+    
+    def _send_worker(self):
+        """Post queued messages one at a time, in the order they were queued"""
+        while True:
+            item = self._send_q.get()
+            try:
+                response = self.client.chat_postMessage(**item)
+                logger.info(f"Message sent successfully: {response.get('ts')}")
+            except SlackApiError as e:
+                logger.error(f"Error sending message: {e.response['error']}")
+            except Exception as e:
+                logger.error(f"Unexpected error sending message: {str(e)}")
+            finally:
+                self._send_q.task_done()
+    
+    def send_summary_to_channel(self, summary_data, reply_to_message=True, wait=True, channel_id=None):
+        """Send a formatted summary back to the Slack channel
+        
+        With wait=False the message is handed to the background sender and
+        None is returned; call flush() to wait for delivery.
+        """
         try:
             # Create formatted message
             message = self._format_summary_message(summary_data)
@@ -312,8 +472,13 @@ class SlackClient:
             if reply_to_message and summary_data.get('slack_message_id'):
                 thread_ts = summary_data['slack_message_id']
             
+            if not wait:
+                self.queue_message(message, thread_ts, channel_id)
+                logger.info(f"Summary queued for: {summary_data.get('title', 'Unknown')}")
+                return None
+            
             # Send the message
-            message_ts = self.send_message(message, thread_ts)
+            message_ts = self.send_message(message, thread_ts, channel_id)
             
             if message_ts:
                 logger.info(f"Summary sent to channel for: {summary_data.get('title', 'Unknown')}")
@@ -334,18 +499,12 @@ class SlackClient:
         tags = summary_data.get('tags', [])
         
         # Create a clean, simple message without formatting
-        message = f"📄 {title}\n"
-        message += f"🔗 {url}\n\n"
-        message += f"{summary}\n\n"
-        
+        parts = [f"📄 {title}", f"🔗 {url}", "", summary, ""]
         if tags:
-            # Limit to 3 most relevant tags
-            limited_tags = tags[:3]
-            message += f"🏷️ {', '.join(limited_tags)}\n"
+            parts.append(f"🏷️ {', '.join(tags[:3])}")  # Limit to 3 most relevant tags
+        parts.append("🤖 AI Summary")
         
-        message += f"🤖 AI Summary"
-        
-        return message
+        return "\n".join(parts)
     
     def upload_file_to_channel(self, file_path, title=None, comment=None, thread_ts=None):
         """Upload a file to the Slack channel"""
@@ -375,8 +534,6 @@ class SlackClient:
     def send_summary_digest(self, summaries_folder, max_summaries=5):
         """Send a digest of recent summaries to the channel"""
         try:
-            from src.summary_organizer import create_summary_digest
-            
             digest = create_summary_digest(summaries_folder, max_summaries)
             
             # Send the digest
@@ -396,8 +553,6 @@ class SlackClient:
     def share_complete_summary_folder(self, summaries_folder):
         """Create and share a complete summary file to the channel"""
         try:
-            from src.summary_organizer import create_shared_summary_folder
-            
             # Create the consolidated markdown file
             output_file = create_shared_summary_folder(summaries_folder)
             
@@ -425,7 +580,10 @@ class SlackClient:
             return None
     
     def get_all_channels(self):
-        """Get list of all channels and DMs the bot has access to"""
+        """Get list of all channels and DMs the bot has access to, reusing recent results"""
+        if self._all_channels_cache and time.monotonic() - self._all_channels_cache[0] < CHANNEL_INFO_TTL:
+            return self._all_channels_cache[1]
+        
         try:
             # Get regular channels
             response = self.client.conversations_list(
@@ -460,6 +618,7 @@ class SlackClient:
                 logger.warning(f"Could not access DMs (missing im:history scope?): {dm_e.response['error']}")
                 logger.info(f"Found {len(member_channels)} channels where bot is a member (out of {len(all_channels)} total)")
             
+            self._all_channels_cache = (time.monotonic(), member_channels)
             return member_channels
             
         except SlackApiError as e:
@@ -478,95 +637,45 @@ class SlackClient:
             total_mentions_processed = 0
             
             # Get recent messages (default to last 2 hours to catch mentions)
-            from datetime import datetime, timedelta
-            if start_date is None:
-                start_date = datetime.now() - timedelta(hours=2)
-            
-            # Separate DMs and channels for different handling
-            dms = [ch for ch in channels if ch.get('is_dm', False)]
-            regular_channels = [ch for ch in channels if not ch.get('is_dm', False)]
+            oldest_ts = start_date.timestamp() if start_date else time.time() - 2 * 3600
             
-            # Process DMs first (usually fewer and more important)
-            # Sort by is_general first, then limit regular channels
-            regular_channels = sorted(regular_channels, key=lambda x: (not x.get('is_general', False), x.get('name', '')))
-            regular_channels = regular_channels[:8]  # Conservative limit for channels
+            all_conversations = self._select_conversations(channels)
             
-            all_conversations = dms + regular_channels
-            
-            logger.info(f"Checking {len(all_conversations)} conversations: {len(dms)} DMs + {len(regular_channels)} channels")
-            
-            for i, conversation in enumerate(all_conversations):
-                conv_id = conversation['id']
-                is_dm = conversation.get('is_dm', False)
-                
-                if is_dm:
-                    # For DMs, get user info
-                    conv_name = f"DM-{conversation.get('user', 'unknown')}"
-                else:
-                    conv_name = f"#{conversation.get('name', 'Unknown')}"
+            # Scan conversations in parallel, then respond to mentions as results arrive
+            with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._scan_channel, conversation, bot_user_id, oldest_ts, limit): conversation
+                    for conversation in all_conversations
+                }
                 
-                logger.debug(f"Checking {conv_name} ({i+1}/{len(all_conversations)})...")
-                
-                try:
-                    # Temporarily switch to this conversation
-                    original_channel = self.channel_id
-                    self.channel_id = conv_id
+                for future in as_completed(futures):
+                    conversation = futures[future]
+                    conv_name = self._conversation_name(conversation)
                     
-                    # Get messages from this conversation with smaller limit for multi-conversation
-                    conversation_limit = min(limit, 10 if is_dm else 20)  # Smaller limit for DMs
-                    messages = self.get_channel_messages(
-                        start_date=start_date,
-                        limit=conversation_limit
-                    )
+                    try:
+                        mentions = future.result()
+                    except SlackApiError as e:
+                        error_code = e.response.get('error', 'unknown')
+                        if error_code == 'not_in_channel':
+                            logger.debug(f"Bot not in {conv_name}, skipping...")
+                        else:
+                            logger.warning(f"Slack API error in {conv_name}: {error_code}")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error checking {conv_name}: {str(e)}")
+                        continue
                     
-                    conv_mentions = 0
-                    for message in messages:
-                        # Skip bot's own messages
-                        if message.get('user') == bot_user_id:
-                            continue
-                        
-                        message_text = message.get('text', '')
-                        
-                        if self.is_mention(message_text, bot_user_id):
-                            logger.info(f"Found mention in {conv_name}: {message.get('ts')}")
-                            self.respond_to_mention(message, bot_user_id)
-                            conv_mentions += 1
-                            total_mentions_processed += 1
+                    conv_mentions = self._respond_to_new_mentions(
+                        mentions, bot_user_id, channel_id=conversation['id'], where=conv_name
+                    )
+                    total_mentions_processed += conv_mentions
                     
                     if conv_mentions > 0:
                         logger.info(f"Processed {conv_mentions} mentions in {conv_name}")
                     else:
                         logger.debug(f"No mentions found in {conv_name}")
-                    
-                    # Restore original channel
-                    self.channel_id = original_channel
-                    
-                    # Add delay between conversations to respect rate limits
-                    if i < len(all_conversations) - 1:  # Don't sleep after the last conversation
-                        time.sleep(1 if is_dm else 2)  # Less delay for DMs
-                    
-                except SlackApiError as e:
-                    error_code = e.response.get('error', 'unknown')
-                    if error_code == 'ratelimited':
-                        retry_after = e.response.get('headers', {}).get('Retry-After', 60)
-                        logger.warning(f"Rate limited, waiting {retry_after} seconds...")
-                        time.sleep(int(retry_after))
-                        # Skip this conversation and continue
-                    elif error_code == 'not_in_channel':
-                        logger.debug(f"Bot not in {conv_name}, skipping...")
-                    else:
-                        logger.warning(f"Slack API error in {conv_name}: {error_code}")
-                    
-                    # Restore original channel on error
-                    self.channel_id = original_channel
-                    continue
-                    
-                except Exception as e:
-                    logger.error(f"Error checking {conv_name}: {str(e)}")
-                    # Restore original channel on error
-                    self.channel_id = original_channel
-                    continue
             
+            self._save_responded()
             logger.info(f"Total mentions processed across {len(all_conversations)} conversations: {total_mentions_processed}")
             return total_mentions_processed
             
@@ -574,11 +683,62 @@ class SlackClient:
             logger.error(f"Error checking all channels for mentions: {str(e)}")
             return 0
 
+    def _select_conversations(self, channels):
+        """Pick which conversations a mention scan covers: every DM, then a few channels"""
+        # Separate DMs and channels for different handling
+        dms = [ch for ch in channels if ch.get('is_dm', False)]
+        regular_channels = [ch for ch in channels if not ch.get('is_dm', False)]
+        
+        # Process DMs first (usually fewer and more important)
+        # Sort by is_general first, then limit regular channels
+        regular_channels = sorted(regular_channels, key=lambda x: (not x.get('is_general', False), x.get('name', '')))
+        regular_channels = regular_channels[:8]  # Conservative limit for channels
+        
+        logger.info(f"Checking {len(dms) + len(regular_channels)} conversations: {len(dms)} DMs + {len(regular_channels)} channels")
+        return dms + regular_channels
+    
+    def _conversation_name(self, conversation):
+        """Human-readable name for a channel or DM, for logging"""
+        if conversation.get('is_dm', False):
+            return f"DM-{conversation.get('user', 'unknown')}"
+        return f"#{conversation.get('name', 'Unknown')}"
+    
+    def _scan_channel(self, conversation, bot_user_id, oldest_ts, limit):
+        """Fetch recent messages from one conversation and return those mentioning the bot
+        
+        Safe to run from worker threads: the channel is passed explicitly and
+        self.channel_id is never touched.
+        """
+        is_dm = conversation.get('is_dm', False)
+        logger.debug(f"Checking {self._conversation_name(conversation)}...")
+        
+        # Smaller limit for multi-conversation scans, smaller still for DMs
+        conversation_limit = min(limit, 10 if is_dm else 20)
+        messages = self.get_channel_messages(
+            oldest_ts=oldest_ts,
+            limit=conversation_limit,
+            channel_id=conversation['id']
+        )
+        
+        return [message for message in messages if self._is_new_mention(message, bot_user_id)]
+    
+    def _is_new_mention(self, message, bot_user_id):
+        """True for a message mentioning the bot that hasn't been answered yet
+        
+        The answered-timestamp lookup comes first, so messages seen on an
+        earlier pass of an overlapping scan window skip the mention regex.
+        """
+        return (
+            message.get('ts') not in self._responded
+            # Skip bot's own messages
+            and message.get('user') != bot_user_id
+            and self.is_mention(message.get('text', ''), bot_user_id)
+        )
+    
     def get_bot_user_id(self):
-        """Get the bot's user ID for mention detection"""
+        """Get the bot's user ID for mention detection (cached after the first lookup)"""
         try:
-            response = self.client.auth_test()
-            return response.get('user_id')
+            return self._get_auth().get('user_id')
         except SlackApiError as e:
             logger.error(f"Error getting bot user ID: {e.response['error']}")
             return None
@@ -591,29 +751,20 @@ class SlackClient:
         if not bot_user_id:
             return False
         
-        # Check for direct user ID mention
-        mention_pattern = f"<@{bot_user_id}>"
-        if mention_pattern in message_text:
-            return True
-        
-        # Check for various bot name mentions (case insensitive)
-        message_lower = message_text.lower()
-        bot_mentions = [
-            "@ailinkscraper",
-            "@ai-link scraper", 
-            "@ai-link-scraper",
-            "@ailink scraper",
-            "@ailink-scraper"
-        ]
-        
-        for mention in bot_mentions:
-            if mention in message_lower:
+        # Name mentions always count; user tags only when they tag this bot
+        for match in _MENTION_RE.finditer(message_text):
+            mentioned_id = match.group(1)
+            if mentioned_id is None or mentioned_id == bot_user_id:
                 return True
         
         return False
     
-    def respond_to_mention(self, message, bot_user_id=None):
-        """Process a mention and respond with link summaries"""
+    def respond_to_mention(self, message, bot_user_id=None, channel_id=None):
+        """Process a mention and respond with link summaries
+        
+        channel_id is the conversation the mention came from (defaults to the
+        configured channel); all replies are posted there.
+        """
         try:
             message_text = message.get('text', '')
             message_ts = message.get('ts')
@@ -624,12 +775,11 @@ class SlackClient:
             # Check if this is a reply to another message
             if thread_ts:
                 logger.info("Detected reply mention, processing parent message for links...")
-                return self.process_reply_mention(message, bot_user_id)
+                return self.process_reply_mention(message, bot_user_id, channel_id)
             
             # Regular mention processing (not a reply)
             # Extract URLs from the mentioned message itself
-            from src.utils import extract_urls_from_text
-            urls = extract_urls_from_text(message_text)
+            urls = self._extract_urls(message_text)
             
             if not urls:
                 # No links in mention, provide helpful response
@@ -642,65 +792,108 @@ class SlackClient:
                           "💡 Try: @ailinkscraper https://example.com/article\\n" \
                           "💡 Or reply to a message with links: @ailinkscraper"
                 
-                self.send_message(response, thread_ts=message_ts)
+                self.send_message(response, thread_ts=message_ts, channel_id=channel_id)
                 return
             
-            # Process each URL mentioned directly
-            from src.web_scraper import WebScraper
-            from src.summarizer import Summarizer
+            # Process the mentioned URLs concurrently, replying in the mention's thread
+            self._summarize_urls(
+                urls,
+                thread_ts=message_ts,
+                channel_id=channel_id,
+                failure_message="❌ Sorry, I couldn't access or process this link: {url}\\n"
+                                "The site might be down, require authentication, or block automated access."
+            )
             
-            scraper = WebScraper()
-            summarizer = Summarizer()
+        except Exception as e:
+            logger.error(f"Error processing mention: {str(e)}")
+            error_response = "❌ Sorry, I encountered an error processing your request. Please try again later."
+            self.send_message(error_response, thread_ts=message.get('ts'), channel_id=channel_id)
+    
+    def _process_one_url(self, url, scraper, summarizer):
+        """Scrape and summarize a single URL, returning summary fields or None on failure"""
+        with self._url_summary_lock:
+            cached = self._url_summary_cache.get(url)
+            if cached:
+                self._url_summary_cache.move_to_end(url)
+        if cached:
+            logger.info(f"Using cached summary for URL: {url}")
+            return dict(cached)
+        
+        logger.info(f"Processing URL: {url}")
+        
+        # Scrape the URL
+        scraped_data = scraper.scrape_url(url)
+        if not scraped_data or scraped_data.get('status') != 'success':
+            return None
+        
+        # Generate summary and tags in one call
+        generated = summarizer.summarize_and_tag(
+            scraped_data['content'],
+            scraped_data.get('title'),
+            scraped_data.get('url')
+        )
+        
+        result = {
+            'url': url,
+            'title': scraped_data.get('title'),
+            'summary': generated['summary'],
+            'tags': generated['tags'],
+            'word_count': scraped_data.get('word_count', 0)
+        }
+        
+        with self._url_summary_lock:
+            self._url_summary_cache[url] = result
+            while len(self._url_summary_cache) > MAX_CACHED_URL_SUMMARIES:
+                self._url_summary_cache.popitem(last=False)
+        
+        return dict(result)
+    
+    def _summarize_urls(self, urls, thread_ts, channel_id=None, failure_message=None, **extra_fields):
+        """Scrape and summarize URLs in parallel and reply to thread_ts as each one finishes
+        
+        Summaries are posted through the background sender and saved to the
+        summaries folder; failure_message (formatted with {url}) is posted for
+        links that could not be scraped. Blocks until every reply is sent.
+        """
+        # The same link may be posted more than once; only process it once
+        urls = list(dict.fromkeys(urls))
+        
+        # One scraper/summarizer shared by all workers; the scraper (and its
+        # connection pool) is kept across mentions
+        if self._scraper is None:
+            self._scraper = WebScraper()
+        scraper = self._scraper
+        summarizer = Summarizer()
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_URL_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(self._process_one_url, url, scraper, summarizer): url for url in urls}
             
-            for url in urls:
-                logger.info(f"Processing mentioned URL: {url}")
-                
-                # Scrape the URL
-                scraped_data = scraper.scrape_url(url)
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    summary_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {url}: {str(e)}")
+                    summary_data = None
                 
-                if scraped_data and scraped_data.get('status') == 'success':
-                    # Generate summary
-                    summary = summarizer.summarize_content(
-                        scraped_data['content'],
-                        scraped_data.get('title'),
-                        scraped_data.get('url')
-                    )
-                    
-                    # Generate tags
-                    tags = summarizer.generate_tags(
-                        scraped_data['content'],
-                        scraped_data.get('title')
-                    )
+                if summary_data:
+                    summary_data['slack_message_id'] = thread_ts
+                    summary_data.update(extra_fields)
                     
-                    # Format summary data
-                    summary_data = {
-                        'url': url,
-                        'title': scraped_data.get('title'),
-                        'summary': summary,
-                        'tags': tags,
-                        'word_count': scraped_data.get('word_count', 0),
-                        'slack_message_id': message_ts
-                    }
-                    
-                    # Send summary as threaded reply
-                    self.send_summary_to_channel(summary_data, reply_to_message=True)
+                    # Send summary as threaded reply (posted in the background)
+                    self.send_summary_to_channel(summary_data, reply_to_message=True, wait=False, channel_id=channel_id)
                     
                     # Save summary to file
-                    from src.utils import save_summary_to_file
                     save_summary_to_file(summary_data, 'summaries')
                     
                     logger.info(f"Successfully processed mention for URL: {url}")
                     
-                else:
+                elif failure_message:
                     # Failed to scrape
-                    error_message = f"❌ Sorry, I couldn't access or process this link: {url}\\n" \
-                                   f"The site might be down, require authentication, or block automated access."
-                    self.send_message(error_message, thread_ts=message_ts)
-            
-        except Exception as e:
-            logger.error(f"Error processing mention: {str(e)}")
-            error_response = "❌ Sorry, I encountered an error processing your request. Please try again later."
-            self.send_message(error_response, thread_ts=message.get('ts'))
+                    self.queue_message(failure_message.format(url=url), thread_ts=thread_ts, channel_id=channel_id)
+        
+        # Make sure every queued reply is delivered before returning
+        self.flush()
     
     def check_for_mentions(self, limit=50, start_date=None):
         """Check recent messages for mentions and respond"""
@@ -711,35 +904,43 @@ class SlackClient:
                 return
             
             # Get recent messages (default to last hour if no start_date provided)
-            from datetime import datetime, timedelta
-            if start_date is None:
-                start_date = datetime.now() - timedelta(hours=1)
+            oldest_ts = start_date.timestamp() if start_date else time.time() - 3600
             
             messages = self.get_channel_messages(
-                start_date=start_date,
+                oldest_ts=oldest_ts,
                 limit=limit
             )
             
-            mentions_processed = 0
-            
-            for message in messages:
-                # Skip bot's own messages
-                if message.get('user') == bot_user_id:
-                    continue
-                
-                message_text = message.get('text', '')
-                
-                if self.is_mention(message_text, bot_user_id):
-                    logger.info(f"Found mention in message: {message.get('ts')}")
-                    self.respond_to_mention(message, bot_user_id)
-                    mentions_processed += 1
-                
-                # Also check threaded replies for this message
-                message_ts = message.get('ts')
-                if message_ts:
-                    thread_mentions = self.check_thread_for_mentions(message_ts, bot_user_id, start_date)
-                    mentions_processed += thread_mentions
+            # Skip bot's own messages
+            messages = [message for message in messages if message.get('user') != bot_user_id]
+            
+            mentions = [message for message in messages if self._is_new_mention(message, bot_user_id)]
+            mentions_processed = self._respond_to_new_mentions(mentions, bot_user_id)
+            
+            # Also check threaded replies, but only for messages that have any
+            thread_parents = [
+                message['ts'] for message in messages
+                if message.get('ts') and message.get('reply_count', 0) > 0
+            ]
+            
+            if thread_parents:
+                # Fetch threads in parallel; respond from this thread as they arrive
+                with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(thread_parents))) as executor:
+                    futures = [
+                        executor.submit(self._scan_thread, thread_ts, bot_user_id, oldest_ts)
+                        for thread_ts in thread_parents
+                    ]
+                    for future in as_completed(futures):
+                        try:
+                            thread_mentions = future.result()
+                        except Exception as e:
+                            logger.error(f"Error checking thread for mentions: {str(e)}")
+                            continue
+                        mentions_processed += self._respond_to_new_mentions(
+                            thread_mentions, bot_user_id, where="thread reply"
+                        )
             
+            self._save_responded()
             logger.info(f"Processed {mentions_processed} mentions")
             return mentions_processed
             
@@ -747,13 +948,12 @@ class SlackClient:
             logger.error(f"Error checking for mentions: {str(e)}")
             return 0
     
-    def get_thread_parent_message(self, thread_ts):
-        """Get the parent message of a thread"""
+    def get_thread_parent_message(self, thread_ts, channel_id=None):
+        """Get the parent message of a thread (the first message returned by conversations_replies)"""
         try:
-            response = self.client.conversations_history(
-                channel=self.channel_id,
-                latest=thread_ts,
-                oldest=thread_ts,
+            response = self.client.conversations_replies(
+                channel=channel_id or self.channel_id,
+                ts=thread_ts,
                 inclusive=True,
                 limit=1
             )
@@ -763,7 +963,7 @@ class SlackClient:
             logger.error(f"Error getting thread parent: {e.response['error']}")
             return None
     
-    def process_reply_mention(self, message, bot_user_id=None):
+    def process_reply_mention(self, message, bot_user_id=None, channel_id=None):
         """Process a mention that's a reply to another message"""
         try:
             thread_ts = message.get('thread_ts')
@@ -771,7 +971,7 @@ class SlackClient:
                 return False  # Not a reply
             
             # Get the parent message that was replied to
-            parent_message = self.get_thread_parent_message(thread_ts)
+            parent_message = self.get_thread_parent_message(thread_ts, channel_id)
             if not parent_message:
                 logger.warning("Could not find parent message for reply")
                 return False
@@ -780,106 +980,67 @@ class SlackClient:
             logger.info(f"Processing reply mention. Parent message: {parent_text[:100]}...")
             
             # Extract URLs from the parent message
-            from src.utils import extract_urls_from_text
-            urls = extract_urls_from_text(parent_text)
+            urls = self._extract_urls(parent_text)
             
             if not urls:
                 # No links in parent message, send helpful response
                 response = "👋 I see you mentioned me in a reply, but I don't see any links in the original message to summarize.\\n\\n" \
                           "💡 **Tip**: Reply to messages that contain links, and I'll summarize them for you!"
                 
-                self.send_message(response, thread_ts=thread_ts)
+                self.send_message(response, thread_ts=thread_ts, channel_id=channel_id)
                 return True
             
-            # Process each URL from the parent message
-            from src.web_scraper import WebScraper
-            from src.summarizer import Summarizer
-            
-            scraper = WebScraper()
-            summarizer = Summarizer()
-            
-            for url in urls:
-                logger.info(f"Processing URL from parent message: {url}")
-                
-                # Scrape the URL
-                scraped_data = scraper.scrape_url(url)
-                
-                if scraped_data and scraped_data.get('status') == 'success':
-                    # Generate summary
-                    summary = summarizer.summarize_content(
-                        scraped_data['content'],
-                        scraped_data.get('title'),
-                        scraped_data.get('url')
-                    )
-                    
-                    # Generate tags
-                    tags = summarizer.generate_tags(
-                        scraped_data['content'],
-                        scraped_data.get('title')
-                    )
-                    
-                    # Format summary data
-                    summary_data = {
-                        'url': url,
-                        'title': scraped_data.get('title'),
-                        'summary': summary,
-                        'tags': tags,
-                        'word_count': scraped_data.get('word_count', 0),
-                        'slack_message_id': thread_ts,  # Use thread timestamp
-                        'reply_to_message': True
-                    }
-                    
-                    # Send summary as threaded reply
-                    self.send_summary_to_channel(summary_data, reply_to_message=True)
-                    
-                    # Save summary to file
-                    from src.utils import save_summary_to_file
-                    save_summary_to_file(summary_data, 'summaries')
-                    
-                    logger.info(f"Successfully processed reply mention for URL: {url}")
-                    
-                else:
-                    # Failed to scrape
-                    error_message = f"❌ Sorry, I couldn't access or process this link from the original message: {url}\\n" \
-                                   f"The site might be down, require authentication, or block automated access."
-                    self.send_message(error_message, thread_ts=thread_ts)
+            # Process the parent message's URLs concurrently, replying in its thread
+            self._summarize_urls(
+                urls,
+                thread_ts=thread_ts,  # Use thread timestamp
+                channel_id=channel_id,
+                failure_message="❌ Sorry, I couldn't access or process this link from the original message: {url}\\n"
+                                "The site might be down, require authentication, or block automated access.",
+                reply_to_message=True
+            )
             
             return True
             
         except Exception as e:
             logger.error(f"Error processing reply mention: {str(e)}")
             error_response = "❌ Sorry, I encountered an error processing your reply. Please try again later."
-            self.send_message(error_response, thread_ts=message.get('thread_ts'))
+            self.send_message(error_response, thread_ts=message.get('thread_ts'), channel_id=channel_id)
             return False
     
-    def check_thread_for_mentions(self, thread_ts, bot_user_id, start_date=None):
+    def _scan_thread(self, thread_ts, bot_user_id, oldest_ts=None, channel_id=None):
+        """Fetch a thread's replies and return those mentioning the bot"""
+        # Get replies in the thread
+        response = self.client.conversations_replies(
+            channel=channel_id or self.channel_id,
+            ts=thread_ts,
+            oldest=oldest_ts
+        )
+        
+        replies = response.get('messages', [])
+        return [
+            reply for reply in replies[1:]  # Skip the first message (parent)
+            if self._is_new_mention(reply, bot_user_id)
+        ]
+    
+    def _respond_to_new_mentions(self, mentions, bot_user_id, channel_id=None, where="message"):
+        """Respond to each mention not answered before and record it; returns how many were answered"""
+        responded = 0
+        for message in mentions:
+            if message.get('ts') in self._responded:
+                continue
+            logger.info(f"Found mention in {where}: {message.get('ts')}")
+            self.respond_to_mention(message, bot_user_id, channel_id=channel_id)
+            self._mark_responded(message.get('ts'))
+            responded += 1
+        return responded
+    
+    def check_thread_for_mentions(self, thread_ts, bot_user_id, start_date=None, channel_id=None):
         """Check threaded replies for mentions"""
         try:
-            from datetime import datetime, timedelta
-            
-            # Get replies in the thread
-            response = self.client.conversations_replies(
-                channel=self.channel_id,
-                ts=thread_ts,
-                oldest=start_date.timestamp() if start_date else None
-            )
-            
-            replies = response.get('messages', [])
-            mentions_found = 0
-            
-            for reply in replies[1:]:  # Skip the first message (parent)
-                # Skip bot's own messages
-                if reply.get('user') == bot_user_id:
-                    continue
-                
-                reply_text = reply.get('text', '')
-                
-                if self.is_mention(reply_text, bot_user_id):
-                    logger.info(f"Found mention in thread reply: {reply.get('ts')}")
-                    self.respond_to_mention(reply, bot_user_id)
-                    mentions_found += 1
-            
-            return mentions_found
+            oldest_ts = start_date.timestamp() if start_date else None
+            mentions = self._scan_thread(thread_ts, bot_user_id, oldest_ts, channel_id)
+            return self._respond_to_new_mentions(mentions, bot_user_id, channel_id, where="thread reply")
             
         except Exception as e:
             logger.error(f"Error checking thread for mentions: {str(e)}")
@@ -903,17 +1064,17 @@ class SlackClient:
         if existing_urls is None:
             existing_urls = set()
             
-        links_data = self.extract_links_from_messages(messages)
-        
-        # Filter out existing URLs
+        # Filter out existing URLs as links stream in, without keeping the full list
         unique_links = []
         new_urls = set()
+        total_links = 0
         
-        for link_data in links_data:
+        for link_data in self.iter_links_from_messages(messages):
+            total_links += 1
             url = link_data.get('url')
             if url and url not in existing_urls and url not in new_urls:
                 unique_links.append(link_data)
                 new_urls.add(url)
                 
-        logger.info(f"Found {len(unique_links)} unique links out of {len(links_data)} total")
+        logger.info(f"Found {len(unique_links)} unique links out of {total_links} total")
         return unique_links
@@ -1,19 +1,509 @@
+import asyncio
+import atexit
+import hashlib
+import io
+import json
 import logging
-import re
+import os
+import sqlite3
+import threading
+import time
+import httpx
+import numpy as np
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from config.settings import settings
 from src.utils import truncate_text
-import re
 
 logger = logging.getLogger(__name__)
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    logger.warning("tiktoken not available. Prompt content will be truncated by characters.")
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+SUMMARY_MODEL = "gpt-3.5-turbo"
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Content tokens per summary prompt, leaving room for instructions and the reply
+MAX_PROMPT_CONTENT_TOKENS = 2500
+
+SUMMARY_INSTRUCTIONS = (
+    "Please provide a very brief summary in 2-3 sentences maximum.",
+    "Focus only on the most important insight or takeaway.",
+)
+
+# Summary and tags from one request, returned as a JSON object
+SUMMARY_AND_TAGS_INSTRUCTIONS = SUMMARY_INSTRUCTIONS + (
+    "Also give 3-5 relevant tags for the content.",
+    'Respond with JSON only, in the form {"summary": "...", "tags": ["...", "..."]}.',
+)
+
+# How long an exact-match result is reused (seconds)
+EXACT_CACHE_TTL = 30 * 86400
+
+# Connection pool shared by every Summarizer, so keep-alive connections (and
+# their TLS sessions) are reused across instances and batches
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+HTTP_TIMEOUT = 60
+
+_clients_lock = threading.Lock()
+_client = None
+_async_runtime = None
+_caches = None
+
+def _shared_client():
+    """Process-wide OpenAI client, created on first use"""
+    global _client
+    with _clients_lock:
+        if _client is None:
+            _client = OpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            )
+        return _client
+
+def _shared_async_runtime():
+    """Process-wide (event loop, AsyncOpenAI client), created on first use
+    
+    The loop runs in a daemon thread for the life of the process; an httpx
+    async pool is tied to the loop it was created on, so one long-lived loop
+    is what lets batches share connections.
+    """
+    global _async_runtime
+    with _clients_lock:
+        if _async_runtime is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            
+            async def create_client():
+                return AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+                )
+            
+            aclient = asyncio.run_coroutine_threadsafe(create_client(), loop).result()
+            _async_runtime = (loop, aclient)
+        return _async_runtime
+
+def _shared_caches():
+    """Process-wide (ExactCache, SummaryCache), opened on first use
+    
+    Loading the semantic cache reads it all from disk, and instances writing
+    to the same files would lose each other's entries, so all Summarizers
+    use one pair.
+    """
+    global _caches
+    with _clients_lock:
+        if _caches is None:
+            _caches = (
+                ExactCache(settings.SUMMARY_CACHE_FILE),
+                SummaryCache(settings.SEMANTIC_CACHE_DIR, settings.SEMANTIC_CACHE_THRESHOLD)
+            )
+        return _caches
+
+@atexit.register
+def _close_shared_clients():
+    """Close pooled connections and the cache database on interpreter exit"""
+    if _client is not None:
+        _client.close()
+    if _caches is not None:
+        _caches[0].close()
+    if _async_runtime is not None:
+        loop, aclient = _async_runtime
+        try:
+            asyncio.run_coroutine_threadsafe(aclient.close(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+class AsyncTokenBucket:
+    """Token bucket refilled continuously at per_minute / 60 tokens per second
+    
+    acquire() waits until enough tokens are available instead of letting a
+    request go out and come back as a 429.
+    """
+    
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, amount=1):
+        """Take amount tokens, sleeping until the bucket has refilled enough"""
+        # A request larger than the whole bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets applied together"""
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests = AsyncTokenBucket(requests_per_minute)
+        self.tokens = AsyncTokenBucket(tokens_per_minute)
+    
+    async def acquire(self, estimated_tokens):
+        """Wait for capacity for one request of about estimated_tokens tokens"""
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
+
+class ExactCache:
+    """Model results keyed by a SHA-256 of the full request, stored in SQLite
+    
+    The key covers model, parameters and prompt, so any change to any of
+    them is a miss. Entries expire after ttl seconds.
+    """
+    
+    def __init__(self, path, ttl=EXACT_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def key(request):
+        """Stable hash of a chat completion request"""
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Cached value for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set(self, key, value):
+        """Store a JSON-serializable value under key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + self.ttl)
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+class SummaryCache:
+    """Summaries and tags keyed by content embedding, matched by cosine similarity
+    
+    Near-duplicate articles (the same post shared twice, a mirrored copy)
+    embed almost identically, so a lookup above the threshold reuses the
+    earlier result instead of calling the model again. Vectors are
+    L2-normalized float32 rows of one contiguous matrix, so a lookup is a
+    single BLAS matrix-vector product; with faiss installed, an
+    IndexFlatIP over the same rows is searched instead.
+    
+    Persisted append-only in cache_dir, so a put writes only what it adds:
+    vectors.f32 holds the raw rows and entries.jsonl one line per put,
+    {"i": row, "v": {field: value}}, with the vector width "d" on the line
+    that adds a row. Meant for one writer per process (see _shared_caches).
+    """
+    
+    def __init__(self, cache_dir, threshold=0.92):
+        self.threshold = threshold
+        self._cache_dir = cache_dir
+        self._vectors_file = os.path.join(cache_dir, 'vectors.f32')
+        self._entries_file = os.path.join(cache_dir, 'entries.jsonl')
+        self._lock = threading.Lock()
+        # Rows [0, _count) of _vectors are in use; capacity doubles as it fills
+        self._vectors = None
+        self._count = 0
+        self._index = None
+        self._entries = []
+        # Set after a failed write, since later rows would no longer line up on disk
+        self._persist_failed = False
+        # Set when entries.jsonl ends in a partial line, so the next append starts a fresh one
+        self._entries_need_newline = False
+        self._load()
+    
+    def _load(self):
+        """Replay cached vectors and results from disk, starting empty if absent"""
+        try:
+            if not os.path.exists(self._entries_file):
+                self._import_legacy_files()
+                return
+            with open(self._entries_file, 'r', encoding='utf-8') as f:
+                raw = f.read()
+            self._entries_need_newline = bool(raw) and not raw.endswith("\n")
+            records = []
+            for line in raw.splitlines():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Blank, or a partial line from an interrupted write
+                    continue
+            dim = next((record['d'] for record in records if 'd' in record), None)
+            if dim is None:
+                return
+            vectors = np.fromfile(self._vectors_file, dtype=np.float32)
+            rows = len(vectors) // dim
+            entries = []
+            for record in records:
+                row = record['i']
+                if row == len(entries) and row < rows:
+                    entries.append({})
+                if row < len(entries):
+                    entries[row].update(record['v'])
+            # Drop rows written without their result line (an interrupted
+            # put), so the next appended row lines up with its index
+            if rows > len(entries) or len(vectors) % dim:
+                with open(self._vectors_file, 'r+b') as f:
+                    f.truncate(len(entries) * dim * 4)
+            self._entries = entries
+            for vector in vectors[:len(entries) * dim].reshape(-1, dim):
+                self._append_vector(vector)
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache: {e}")
+            self._entries, self._vectors, self._count, self._index = [], None, 0, None
+    
+    def _import_legacy_files(self):
+        """Convert a cache saved as cache.npz / cache.jsonl snapshots, if one exists"""
+        legacy_vectors = os.path.join(self._cache_dir, 'cache.npz')
+        legacy_entries = os.path.join(self._cache_dir, 'cache.jsonl')
+        if not os.path.exists(legacy_vectors):
+            return
+        vectors = np.load(legacy_vectors)['vectors']
+        with open(legacy_entries, 'r', encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        if len(entries) != len(vectors):
+            logger.warning("Semantic cache files are out of sync, starting empty")
+            return
+        for vector, entry in zip(vectors, entries):
+            self._append_vector(vector)
+            self._entries.append(entry)
+        self._persist(
+            [{"i": row, "d": vectors.shape[1], "v": entry} for row, entry in enumerate(entries)],
+            self._vectors[:self._count]
+        )
+    
+    def _persist(self, records, vectors=None):
+        """Append new vector rows, then the lines recording them (caller holds the lock)"""
+        if self._persist_failed:
+            return
+        try:
+            os.makedirs(self._cache_dir or '.', exist_ok=True)
+            if vectors is not None:
+                with open(self._vectors_file, 'ab') as f:
+                    f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            lines = "".join(json.dumps(record) + "\n" for record in records)
+            if self._entries_need_newline:
+                lines = "\n" + lines
+                self._entries_need_newline = False
+            with open(self._entries_file, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except Exception as e:
+            self._persist_failed = True
+            logger.warning(f"Could not save semantic cache, keeping it in memory only: {e}")
+    
+    def _append_vector(self, vector):
+        """Add a normalized vector as the next row, growing storage geometrically"""
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+        if self._vectors is None:
+            self._vectors = np.empty((16, vector.shape[0]), dtype=np.float32)
+            if FAISS_AVAILABLE:
+                self._index = faiss.IndexFlatIP(vector.shape[0])
+        elif self._count == len(self._vectors):
+            grown = np.empty((2 * len(self._vectors), self._vectors.shape[1]), dtype=np.float32)
+            grown[:self._count] = self._vectors[:self._count]
+            self._vectors = grown
+        self._vectors[self._count] = vector
+        self._count += 1
+        if self._index is not None:
+            self._index.add(vector[np.newaxis, :])
+    
+    def _nearest(self, vector):
+        """Index of the most similar cached entry at or above the threshold, else None"""
+        if not self._count:
+            return None
+        if self._index is not None:
+            similarities, indices = self._index.search(vector[np.newaxis, :].astype(np.float32), 1)
+            best, similarity = int(indices[0][0]), similarities[0][0]
+        else:
+            similarities = self._vectors[:self._count] @ vector
+            best = int(np.argmax(similarities))
+            similarity = similarities[best]
+        return best if best >= 0 and similarity >= self.threshold else None
+    
+    def get(self, vector, field):
+        """Cached value of field ('summary' or 'tags') for a similar item, or None"""
+        with self._lock:
+            index = self._nearest(vector)
+            return None if index is None else self._entries[index].get(field)
+    
+    def put(self, vector, values):
+        """Store results ({'summary': ..., 'tags': ...}), filling in the matching entry if there is one"""
+        with self._lock:
+            index = self._nearest(vector)
+            if index is not None:
+                self._entries[index].update(values)
+                self._persist([{"i": index, "v": values}])
+            else:
+                self._append_vector(vector)
+                self._entries.append(dict(values))
+                row = self._count - 1
+                self._persist([{"i": row, "d": self._vectors.shape[1], "v": values}], self._vectors[row:row + 1])
+
 class Summarizer:
     def __init__(self):
-        """Initialize OpenAI client"""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        """Initialize OpenAI client and result caches (shared by all instances)"""
+        self.client = _shared_client()
         self.max_length = settings.SUMMARY_MAX_LENGTH
+        # Exact repeats are answered from disk before any embedding or model call
+        self.exact_cache, self.semantic_cache = _shared_caches()
+        # Last embedding computed, so the tags lookup reuses the summary's
+        self._last_embedding = (None, None)
+        self._encoding = self._load_encoding()
+    
+    def _load_encoding(self):
+        """Tokenizer for the summary model, or None to fall back to character limits"""
+        if not TIKTOKEN_AVAILABLE:
+            return None
+        try:
+            return tiktoken.encoding_for_model(SUMMARY_MODEL)
+        except Exception as e:
+            logger.warning(f"Could not load tokenizer for {SUMMARY_MODEL}: {e}")
+            return None
+    
+    def _truncate_content(self, content):
+        """Cut content to the prompt budget, by tokens when a tokenizer is available"""
+        if self._encoding is not None:
+            # Tokens average about 4 characters of English text, so 8 per token
+            # leaves ample margin over the budget while bounding encode work
+            content = content[:MAX_PROMPT_CONTENT_TOKENS * 8]
+            tokens = self._encoding.encode(content, disallowed_special=())
+            if len(tokens) > MAX_PROMPT_CONTENT_TOKENS:
+                content = self._encoding.decode(tokens[:MAX_PROMPT_CONTENT_TOKENS]) + "..."
+            return content
+        
+        # Without a tokenizer, cap at 3000 characters (a conservative token
+        # estimate), cutting at the last space in the window so no word is split
+        max_content_length = 3000
+        if len(content) > max_content_length:
+            cut = content.rfind(' ', max_content_length // 2, max_content_length)
+            content = content[:cut if cut > 0 else max_content_length] + "..."
+        return content
+    
+    def _embed(self, content, title=None):
+        """Normalized embedding of an item's title and first 1KB, or None on failure"""
+        key_text = f"{title or ''}\n{content[:1024]}"
+        last_key, last_vector = self._last_embedding
+        if key_text == last_key:
+            return last_vector
         
+        try:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=key_text)
+        except Exception as e:
+            logger.warning(f"Could not embed content for cache lookup: {e}")
+            return None
+        
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        self._last_embedding = (key_text, vector)
+        return vector
+        
+    def summarize_and_tag(self, content, title=None, url=None):
+        """Generate a summary and tags together in a single OpenAI call
+        
+        Returns {'summary': str, 'tags': list}. Uses the same exact-match and
+        semantic caches as summarize_content and generate_tags.
+        """
+        try:
+            if not content or len(content.strip()) < 50:
+                logger.warning("Content too short to summarize")
+                return {'summary': "Content too short for meaningful summarization.", 'tags': []}
+            
+            request = self._summary_and_tags_request(content, title, url)
+            cache_key = ExactCache.key(request)
+            cached = self.exact_cache.get(cache_key)
+            if cached:
+                logger.info("Using cached summary and tags for identical content")
+                return cached
+            
+            # Reuse a near-identical article's results only if both are cached
+            vector = self._embed(content, title)
+            if vector is not None:
+                summary = self.semantic_cache.get(vector, 'summary')
+                tags = self.semantic_cache.get(vector, 'tags')
+                if summary and tags:
+                    logger.info("Using cached summary and tags for similar content")
+                    return {'summary': summary, 'tags': tags}
+            
+            logger.info(f"Generating summary and tags for content ({len(content)} characters)")
+            
+            response = self.client.chat.completions.create(**request)
+            self._log_cached_tokens(response)
+            result = self._parse_summary_and_tags(response.choices[0].message.content)
+            
+            self.exact_cache.set(cache_key, result)
+            if vector is not None:
+                values = {'summary': result['summary']}
+                if result['tags']:
+                    values['tags'] = result['tags']
+                self.semantic_cache.put(vector, values)
+            
+            logger.info(f"Generated summary ({len(result['summary'])} characters) and tags: {result['tags']}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            return {'summary': f"Error generating summary: {str(e)}", 'tags': []}
+    
+    def _summary_and_tags_request(self, content, title=None, url=None):
+        """Chat completion arguments for a combined summary-and-tags JSON reply"""
+        return {
+            'model': SUMMARY_MODEL,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant that creates very concise, punchy summaries and relevant tags, answering in JSON. Keep summaries to 2-3 complete sentences maximum. Always end with a complete sentence - never use ellipses (...) or trailing off. Focus only on the most important insight or takeaway."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_prompt(content, title, url, SUMMARY_AND_TAGS_INSTRUCTIONS, "JSON:")
+                }
+            ],
+            'response_format': {"type": "json_object"},
+            'max_tokens': 200,
+            'temperature': 0.3,
+            'top_p': 0.9
+        }
+    
+    def _parse_summary_and_tags(self, text):
+        """Summary and tags from a combined JSON reply, post-processed like the separate calls"""
+        data = json.loads(text)
+        tags = data.get('tags') or []
+        if isinstance(tags, str):
+            tags = self._parse_tags(tags)
+        else:
+            tags = [str(tag).strip().lower() for tag in tags if str(tag).strip()][:5]
+        return {'summary': self._finish_summary(str(data.get('summary', ''))), 'tags': tags}
+    
     def summarize_content(self, content, title=None, url=None):
         """Generate a summary of the given content using OpenAI"""
         try:
@@ -21,37 +511,31 @@ class Summarizer:
                 logger.warning("Content too short to summarize")
                 return "Content too short for meaningful summarization."
             
-            # Prepare the prompt
-            prompt = self._create_prompt(content, title, url)
+            request = self._summary_request(content, title, url)
+            cache_key = ExactCache.key(request)
+            cached = self.exact_cache.get(cache_key)
+            if cached:
+                logger.info("Using cached summary for identical content")
+                return cached
+            
+            # Reuse the summary of a near-identical article if we have one
+            vector = self._embed(content, title)
+            if vector is not None:
+                cached = self.semantic_cache.get(vector, 'summary')
+                if cached:
+                    logger.info("Using cached summary for similar content")
+                    return cached
             
             logger.info(f"Generating summary for content ({len(content)} characters)")
             
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that creates very concise, punchy summaries. Keep summaries to 2-3 complete sentences maximum. Always end with a complete sentence - never use ellipses (...) or trailing off. Focus only on the most important insight or takeaway."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=120,  # Slightly increased to allow for complete sentences
-                temperature=0.3,
-                top_p=0.9
-            )
-            
-            summary = response.choices[0].message.content.strip()
+            response = self.client.chat.completions.create(**request)
+            self._log_cached_tokens(response)
+            summary = self._finish_summary(response.choices[0].message.content)
             
-            # Post-process to ensure complete sentences
-            summary = self._ensure_complete_sentences(summary)
-            
-            # Ensure summary doesn't exceed max length (with smart truncation)
-            if len(summary) > self.max_length:
-                summary = truncate_text(summary, self.max_length)
+            self.exact_cache.set(cache_key, summary)
+            if vector is not None:
+                self.semantic_cache.put(vector, {'summary': summary})
             
             logger.info(f"Generated summary ({len(summary)} characters)")
             return summary
@@ -60,46 +544,70 @@ class Summarizer:
             logger.error(f"Error generating summary: {str(e)}")
             return f"Error generating summary: {str(e)}"
     
+    def _summary_request(self, content, title=None, url=None):
+        """Chat completion arguments for summarizing content"""
+        return {
+            'model': SUMMARY_MODEL,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant that creates very concise, punchy summaries. Keep summaries to 2-3 complete sentences maximum. Always end with a complete sentence - never use ellipses (...) or trailing off. Focus only on the most important insight or takeaway."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_prompt(content, title, url)
+                }
+            ],
+            'max_tokens': 120,  # Slightly increased to allow for complete sentences
+            'temperature': 0.3,
+            'top_p': 0.9
+        }
+    
+    def _log_cached_tokens(self, response):
+        """Log how much of the prompt OpenAI served from its prefix cache"""
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        if details is not None:
+            logger.debug(f"Prompt tokens: {usage.prompt_tokens}, cached: {details.cached_tokens or 0}")
+    
+    def _finish_summary(self, text):
+        """Post-process a model summary: complete sentences, capped at max_length"""
+        summary = self._ensure_complete_sentences(text.strip())
+        
+        # Ensure summary doesn't exceed max length (with smart truncation)
+        if len(summary) > self.max_length:
+            summary = truncate_text(summary, self.max_length)
+        return summary
+    
     def _ensure_complete_sentences(self, text):
         """Ensure text ends with complete sentences and remove any trailing ellipses"""
         if not text:
             return text
         
-        # Remove any trailing ellipses or incomplete fragments
-        text = re.sub(r'\.\.\.$', '', text.strip())
-        text = re.sub(r'\s*\.\.\.\s*$', '', text.strip())
+        # Remove a trailing ellipsis
+        text = text.strip()
+        if text.endswith('...'):
+            text = text[:-3].rstrip()
         
-        # If text doesn't end with proper punctuation, add a period
+        # If text doesn't end with proper punctuation, cut back to the last
+        # complete sentence, or add a period if there isn't one
         if text and not text.endswith(('.', '!', '?')):
-            # Check if the last character is part of an incomplete word
-            # If so, find the last complete sentence
-            sentence_endings = ['.', '!', '?']
-            last_complete_sentence = -1
-            
-            for i in range(len(text) - 1, -1, -1):
-                if text[i] in sentence_endings:
-                    last_complete_sentence = i
-                    break
-            
+            last_complete_sentence = max(text.rfind('.'), text.rfind('!'), text.rfind('?'))
             if last_complete_sentence > 0:
-                # Truncate to the last complete sentence
                 text = text[:last_complete_sentence + 1]
             else:
-                # Add a period to make it complete
                 text += '.'
         
         return text
-        
-        return text
 
-    def _create_prompt(self, content, title=None, url=None):
+    def _create_prompt(self, content, title=None, url=None, instructions=SUMMARY_INSTRUCTIONS, answer_label="Summary:"):
         """Create an effective prompt for summarization"""
         # Truncate content if it's too long (GPT-3.5-turbo has token limits)
-        max_content_length = 3000  # Conservative limit for tokens
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        content = self._truncate_content(content)
         
-        prompt_parts = []
+        # Invariant instructions first and per-item details last, so every
+        # request shares the same prefix for OpenAI's automatic prompt caching
+        prompt_parts = [*instructions, "---"]
         
         if url:
             prompt_parts.append(f"URL: {url}")
@@ -108,13 +616,11 @@ class Summarizer:
             prompt_parts.append(f"Title: {title}")
         
         prompt_parts.extend([
-            "Please provide a very brief summary in 2-3 sentences maximum.",
-            "Focus only on the most important insight or takeaway.",
             "",
             "Content:",
             content,
             "",
-            "Summary:"
+            answer_label
         ])
         
         return "\n".join(prompt_parts)
@@ -122,75 +628,219 @@ class Summarizer:
     def generate_tags(self, content, title=None):
         """Generate relevant tags for the content"""
         try:
-            prompt = f"Generate 3-5 relevant tags for this content. Return only the tags separated by commas.\n\n"
-            
-            if title:
-                prompt += f"Title: {title}\n\n"
-            
-            # Use first 1000 characters for tag generation
-            content_sample = content[:1000] if content else ""
-            prompt += f"Content: {content_sample}"
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a helpful assistant that generates relevant tags for content. Return only the tags separated by commas, no explanations."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=50,
-                temperature=0.3
-            )
+            request = self._tags_request(content, title)
+            cache_key = ExactCache.key(request)
+            cached = self.exact_cache.get(cache_key)
+            if cached:
+                logger.info(f"Using cached tags for identical content: {cached}")
+                return cached
+            
+            vector = self._embed(content, title) if content else None
+            if vector is not None:
+                cached = self.semantic_cache.get(vector, 'tags')
+                if cached:
+                    logger.info(f"Using cached tags for similar content: {cached}")
+                    return cached
             
-            tags_text = response.choices[0].message.content.strip()
-            tags = [tag.strip().lower() for tag in tags_text.split(',') if tag.strip()]
+            response = self.client.chat.completions.create(**request)
+            self._log_cached_tokens(response)
+            tags = self._parse_tags(response.choices[0].message.content)
+            
+            if tags:
+                self.exact_cache.set(cache_key, tags)
+            if vector is not None and tags:
+                self.semantic_cache.put(vector, {'tags': tags})
             
             logger.info(f"Generated tags: {tags}")
-            return tags[:5]  # Limit to 5 tags
+            return tags
             
         except Exception as e:
             logger.error(f"Error generating tags: {str(e)}")
             return []
     
+    def _tags_request(self, content, title=None):
+        """Chat completion arguments for tagging content"""
+        prompt = f"Generate 3-5 relevant tags for this content. Return only the tags separated by commas.\n\n"
+        
+        if title:
+            prompt += f"Title: {title}\n\n"
+        
+        # Use first 1000 characters for tag generation
+        content_sample = content[:1000] if content else ""
+        prompt += f"Content: {content_sample}"
+        
+        return {
+            'model': SUMMARY_MODEL,
+            'messages': [
+                {
+                    "role": "system", 
+                    "content": "You are a helpful assistant that generates relevant tags for content. Return only the tags separated by commas, no explanations."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            'max_tokens': 50,
+            'temperature': 0.3
+        }
+    
+    def _parse_tags(self, text):
+        """Split a comma-separated model reply into at most 5 lowercase tags"""
+        tags = [tag.strip().lower() for tag in text.strip().split(',') if tag.strip()]
+        return tags[:5]  # Limit to 5 tags
+    
     def batch_summarize(self, scraped_data):
-        """Summarize multiple pieces of content"""
-        summaries = []
+        """Summarize multiple pieces of content
         
+        Each item gets one combined summary-and-tags request, and all of them
+        are sent concurrently (at most settings.MAX_CONCURRENCY in flight), so
+        a batch takes roughly as long as its slowest item rather than the sum
+        of all of them.
+        """
+        valid = []
         for i, data in enumerate(scraped_data):
             if data.get('status') != 'success' or not data.get('content'):
                 logger.warning(f"Skipping item {i+1}: {data.get('url', 'Unknown URL')}")
                 continue
-            
-            logger.info(f"Summarizing item {i+1}/{len(scraped_data)}: {data.get('url', 'Unknown URL')}")
-            
-            # Generate summary
-            summary = self.summarize_content(
-                data['content'],
-                data.get('title'),
-                data.get('url')
-            )
-            
-            # Generate tags
-            tags = self.generate_tags(
-                data['content'],
-                data.get('title')
-            )
-            
-            summary_data = {
+            valid.append(data)
+        
+        logger.info(f"Summarizing {len(valid)} of {len(scraped_data)} items concurrently")
+        if valid:
+            loop, aclient = _shared_async_runtime()
+            summaries = asyncio.run_coroutine_threadsafe(self._abatch_summarize(aclient, valid), loop).result()
+        else:
+            summaries = []
+        
+        logger.info(f"Completed summarization of {len(summaries)} items")
+        return summaries
+    
+    def batch_summarize_offline(self, scraped_data, poll_interval=60):
+        """Summarize multiple pieces of content through the OpenAI Batch API
+        
+        For offline jobs that can wait: requests are billed at the batch rate
+        and don't count against the interactive rate limits, but results can
+        take up to 24 hours. Blocks, polling every poll_interval seconds,
+        until the batch finishes.
+        """
+        valid = [
+            data for data in scraped_data
+            if data.get('status') == 'success' and data.get('content')
+        ]
+        if not valid:
+            return []
+        
+        # One combined summary-and-tags request per item, keyed by its index
+        lines = [
+            json.dumps({
+                'custom_id': str(i),
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._summary_and_tags_request(data['content'], data.get('title'), data.get('url'))
+            })
+            for i, data in enumerate(valid)
+        ]
+        
+        batch_input = io.BytesIO("\n".join(lines).encode('utf-8'))
+        batch_input.name = 'batch_summarize.jsonl'
+        input_file = self.client.files.create(file=batch_input, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.info(f"Batch {batch.id} status: {batch.status}")
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            logger.error(f"Batch {batch.id} finished with status {batch.status}")
+            return []
+        
+        # Collect replies by custom_id; failed requests are simply absent
+        replies = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get('response') or {}
+            if response.get('status_code') == 200:
+                replies[result['custom_id']] = response['body']['choices'][0]['message']['content']
+        
+        summaries = []
+        for i, data in enumerate(valid):
+            try:
+                result = self._parse_summary_and_tags(replies[str(i)])
+            except Exception as e:
+                logger.error(f"Error generating summary: batch request {i} failed: {e}")
+                result = {'summary': "Error generating summary: batch request failed", 'tags': []}
+            summaries.append({
                 'url': data['url'],
                 'title': data['title'],
-                'summary': summary,
-                'tags': tags,
+                'summary': result['summary'],
+                'tags': result['tags'],
                 'word_count': data.get('word_count', 0),
-                'original_content_length': len(data.get('content', ''))
-            }
-            
-            summaries.append(summary_data)
+                'original_content_length': len(data['content'])
+            })
         
-        logger.info(f"Completed summarization of {len(summaries)} items")
+        logger.info(f"Completed batch summarization of {len(summaries)} items")
         return summaries
+    
+    async def _abatch_summarize(self, aclient, items):
+        """Summarize and tag every item concurrently, preserving input order"""
+        sem = asyncio.Semaphore(settings.MAX_CONCURRENCY)
+        # Stay just under the account limits rather than bouncing off 429s
+        limiter = RateLimiter(settings.OPENAI_REQUESTS_PER_MINUTE, settings.OPENAI_TOKENS_PER_MINUTE)
+        return await asyncio.gather(*(self._summarize_one(aclient, data, sem, limiter) for data in items))
+    
+    def _estimate_tokens(self, request):
+        """Rough token cost of a request: its prompt plus the reply budget"""
+        text = "".join(message['content'] for message in request['messages'])
+        if self._encoding is not None:
+            prompt_tokens = len(self._encoding.encode(text, disallowed_special=()))
+        else:
+            prompt_tokens = len(text) // 4
+        return prompt_tokens + request.get('max_tokens', 0)
+    
+    async def _summarize_one(self, aclient, data, sem, limiter=None):
+        """Summary and tags for one scraped item from a single combined request"""
+        content = data['content']
+        
+        async with sem:
+            if len(content.strip()) < 50:
+                summary, tags = "Content too short for meaningful summarization.", []
+            else:
+                try:
+                    reply = await self._acomplete(
+                        aclient, self._summary_and_tags_request(content, data.get('title'), data.get('url')), limiter
+                    )
+                    result = self._parse_summary_and_tags(reply)
+                    summary, tags = result['summary'], result['tags']
+                except Exception as e:
+                    logger.error(f"Error generating summary: {str(e)}")
+                    summary, tags = f"Error generating summary: {str(e)}", []
+        
+        return {
+            'url': data['url'],
+            'title': data['title'],
+            'summary': summary,
+            'tags': tags,
+            'word_count': data.get('word_count', 0),
+            'original_content_length': len(content)
+        }
+    
+    @retry(
+        retry=retry_if_exception_type(openai.RateLimitError),
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(6),
+        reraise=True
+    )
+    async def _acomplete(self, aclient, request, limiter=None):
+        """Run one chat completion, backing off exponentially on rate limits"""
+        if limiter is not None:
+            await limiter.acquire(self._estimate_tokens(request))
+        response = await aclient.chat.completions.create(**request)
+        return response.choices[0].message.content
@@ -1,7 +1,136 @@
 import json
-import os
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from src.utils import SUMMARY_INDEX_FILE, append_to_summary_index, dated_summary_files
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Summary files are small, so loading them is dominated by per-file open/read
+# latency; reading in parallel overlaps it
+MAX_LOAD_WORKERS = 32
+
+def _load_json(file_path):
+    """Read one summary file, returning (path, data, error)"""
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        return file_path, orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw), None
+    except Exception as e:
+        return file_path, None, e
+
+def _iter_summaries(summary_files):
+    """Yield (path, data, error) for each summary file, loaded in parallel but in order"""
+    with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as executor:
+        yield from executor.map(_load_json, summary_files)
+
+def _load_summaries(summary_files):
+    """Load summary files in parallel, preserving their order"""
+    return list(_iter_summaries(summary_files))
+
+# Output is written as it is rendered, through a large buffer
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+def _dated_files_in_range(summaries_path, start_ts, end_ts):
+    """(mtime, path) for summary files modified within [start_ts, end_ts]
+    
+    Reads the folder's summary index so only files in the window are
+    touched. A folder without an index is scanned once to create it.
+    """
+    index_path = summaries_path / SUMMARY_INDEX_FILE
+    if not index_path.exists():
+        append_to_summary_index(summaries_path, [])
+    
+    # Later entries for the same file win; skip files that have since been removed
+    in_range = {}
+    with open(index_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if start_ts <= entry['t'] <= end_ts:
+                in_range[entry['f']] = entry['t']
+            else:
+                in_range.pop(entry['f'], None)
+    
+    return [
+        (mtime, str(summaries_path / name)) for name, mtime in in_range.items()
+        if (summaries_path / name).exists()
+    ]
+
+def _newest_first(dated_files):
+    """Paths from (mtime, path) pairs, newest first"""
+    dated_files.sort(key=lambda item: item[0], reverse=True)
+    return [file_path for _, file_path in dated_files]
+
+def _render_markdown_item(i, summary_data):
+    """Markdown section for one summary in the shared summaries file"""
+    title = summary_data.get('title', 'Unknown Title')
+    url = summary_data.get('url', '')
+    summary = summary_data.get('summary', 'No summary available')
+    tags = summary_data.get('tags', [])
+    word_count = summary_data.get('word_count', 0)
+    processed_date = summary_data.get('processed_date', 'Unknown')
+    
+    parts = [f"## {i}. {title}\n\nLink: {url}\n\nSummary: {summary}\n\n"]
+    
+    if tags:
+        parts.append(f"Tags: {', '.join(tags)}\n\n")
+    
+    if word_count > 0:
+        parts.append(f"Length: {word_count:,} words\n\n")
+    
+    parts.append(f"Processed: {processed_date}\n\n---\n\n")
+    return "".join(parts)
+
+def _escape_html_fields(summary_data):
+    """Summary fields with text HTML-escaped, for the weekly document
+    
+    Escaped once per record, since the title appears in both the table of
+    contents and the body.
+    """
+    return {
+        'title': escape(str(summary_data.get('title', 'Unknown Title'))),
+        'url': escape(str(summary_data.get('url', ''))),
+        'summary': escape(str(summary_data.get('summary', 'No summary available'))),
+        'tags': [escape(str(tag)) for tag in summary_data.get('tags', [])],
+        'word_count': summary_data.get('word_count', 0),
+        'processed_date': escape(str(summary_data.get('processed_date', 'Unknown')))
+    }
+
+def _render_html_item(i, fields):
+    """HTML block for one summary in the weekly document, from escaped fields"""
+    title = fields['title']
+    url = fields['url']
+    summary = fields['summary']
+    tags = fields['tags']
+    word_count = fields['word_count']
+    processed_date = fields['processed_date']
+    
+    parts = [f"""
+    <div class="summary-item" id="item{i}">
+        <h2>{i}. {title}</h2>
+        <p class="url"><strong>🔗 Link:</strong> <a href="{url}" target="_blank">{url}</a></p>
+        <p><strong>📝 Summary:</strong></p>
+        <p>{summary}</p>
+"""]
+    
+    if tags:
+        parts.append(f'        <p class="tags"><strong>🏷️ Tags:</strong> {", ".join(tags)}</p>\n')
+    
+    parts.append(f"""        <p class="meta">
+            <strong>📊 Length:</strong> {word_count:,} words | 
+            <strong>⏰ Processed:</strong> {processed_date}
+        </p>
+    </div>
+""")
+    return "".join(parts)
 
 def create_shared_summary_folder(summaries_folder, output_file="shared_summaries.md"):
     """Create a consolidated markdown file with all summaries"""
@@ -10,54 +139,30 @@ def create_shared_summary_folder(summaries_folder, output_file="shared_summaries
     if not summaries_path.exists():
         return None
     
-    # Collect all summary files
-    summary_files = list(summaries_path.glob("*.json"))
+    # Collect all summary files, newest first
+    summary_files = _newest_first(dated_summary_files(summaries_path))
     
     if not summary_files:
         return None
     
-    # Sort by creation time (newest first)
-    summary_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    
-    # Create markdown content
-    markdown_content = f"# AI Link Summaries\n\n"
-    markdown_content += f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    markdown_content += f"Total Summaries: {len(summary_files)}\n\n"
-    markdown_content += "---\n\n"
-    
-    for i, file_path in enumerate(summary_files, 1):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
-            
-            title = summary_data.get('title', 'Unknown Title')
-            url = summary_data.get('url', '')
-            summary = summary_data.get('summary', 'No summary available')
-            tags = summary_data.get('tags', [])
-            word_count = summary_data.get('word_count', 0)
-            processed_date = summary_data.get('processed_date', 'Unknown')
-            
-            markdown_content += f"## {i}. {title}\n\n"
-            markdown_content += f"Link: {url}\n\n"
-            markdown_content += f"Summary: {summary}\n\n"
-            
-            if tags:
-                markdown_content += f"Tags: {', '.join(tags)}\n\n"
-            
-            if word_count > 0:
-                markdown_content += f"Length: {word_count:,} words\n\n"
-            
-            markdown_content += f"Processed: {processed_date}\n\n"
-            markdown_content += "---\n\n"
-            
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            continue
-    
-    # Write to output file
+    # Write markdown straight to the output file, one summary at a time
     output_path = summaries_path.parent / output_file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(
+            "# AI Link Summaries\n\n"
+            f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            f"Total Summaries: {len(summary_files)}\n\n"
+            "---\n\n"
+        )
+        
+        for i, (file_path, summary_data, error) in enumerate(_iter_summaries(summary_files), 1):
+            try:
+                if error:
+                    raise error
+                f.write(_render_markdown_item(i, summary_data))
+            except Exception as e:
+                print(f"Error processing {file_path}: {e}")
+                continue
     
     return str(output_path)
 
@@ -68,32 +173,31 @@ def create_summary_digest(summaries_folder, max_summaries=10):
     if not summaries_path.exists():
         return "No summaries found."
     
-    summary_files = list(summaries_path.glob("*.json"))
+    # Newest first, then limit
+    summary_files = _newest_first(dated_summary_files(summaries_path))
     
     if not summary_files:
         return "No summaries found."
     
-    # Sort by creation time (newest first) and limit
-    summary_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
     recent_files = summary_files[:max_summaries]
     
-    digest = f"📋 **Summary Digest** ({len(recent_files)} recent items)\n\n"
+    parts = [f"📋 **Summary Digest** ({len(recent_files)} recent items)\n\n"]
     
-    for i, file_path in enumerate(recent_files, 1):
+    for i, (file_path, summary_data, error) in enumerate(_load_summaries(recent_files), 1):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
+            if error:
+                continue
             
             title = summary_data.get('title', 'Unknown Title')[:50] + "..." if len(summary_data.get('title', '')) > 50 else summary_data.get('title', 'Unknown Title')
             summary = summary_data.get('summary', 'No summary available')[:100] + "..." if len(summary_data.get('summary', '')) > 100 else summary_data.get('summary', 'No summary available')
             
-            digest += f"{i}. **{title}**\n   {summary}\n\n"
+            parts.append(f"{i}. **{title}**\n   {summary}\n\n")
             
         except Exception as e:
             continue
     
-    digest += f"\n_Total summaries available: {len(summary_files)}_"
-    return digest
+    parts.append(f"\n_Total summaries available: {len(summary_files)}_")
+    return "".join(parts)
 
 def create_weekly_document(summaries_folder, start_date=None):
     """Create a weekly summary document (PDF-ready HTML) with summaries from the past week"""
@@ -111,24 +215,33 @@ def create_weekly_document(summaries_folder, start_date=None):
     else:
         end_date = start_date + timedelta(days=7)
     
-    # Collect summary files from the past week
-    summary_files = []
-    for file_path in summaries_path.glob("*.json"):
-        try:
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            if start_date <= file_mtime <= end_date:
-                summary_files.append(file_path)
-        except Exception:
-            continue
+    # Collect summary files from the past week, keeping the mtime read for the
+    # date filter so sorting doesn't stat each file again
+    dated_files = _dated_files_in_range(summaries_path, start_date.timestamp(), end_date.timestamp())
     
-    if not summary_files:
+    if not dated_files:
         return None
     
     # Sort by creation time (newest first)
-    summary_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    summary_files = _newest_first(dated_files)
+    
+    # Read and escape every file once; the table of contents and the body both use it
+    records = []
+    for i, (file_path, summary_data, error) in enumerate(_iter_summaries(summary_files), 1):
+        if error:
+            continue
+        try:
+            records.append((i, _escape_html_fields(summary_data)))
+        except Exception:
+            continue
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_filename = f"weekly_summary_{start_date.strftime('%Y%m%d')}_{timestamp}.html"
+    output_path = summaries_path.parent / output_filename
     
-    # Create HTML content for PDF generation
-    html_content = f"""
+    # Write HTML for PDF generation straight to the output file
+    with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -158,71 +271,30 @@ def create_weekly_document(summaries_folder, start_date=None):
     <div class="toc">
         <h2>📋 Table of Contents</h2>
         <ul>
-"""
-    
-    # Add table of contents
-    for i, file_path in enumerate(summary_files, 1):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
-            title = summary_data.get('title', 'Unknown Title')
-            html_content += f'            <li><a href="#item{i}">{i}. {title}</a></li>\n'
-        except Exception:
-            continue
-    
-    html_content += """        </ul>
+""")
+        
+        # Add table of contents
+        for i, fields in records:
+            f.write(f'            <li><a href="#item{i}">{i}. {fields["title"]}</a></li>\n')
+        
+        f.write("""        </ul>
     </div>
     
-"""
-    
-    # Add detailed summaries
-    for i, file_path in enumerate(summary_files, 1):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
-            
-            title = summary_data.get('title', 'Unknown Title')
-            url = summary_data.get('url', '')
-            summary = summary_data.get('summary', 'No summary available')
-            tags = summary_data.get('tags', [])
-            word_count = summary_data.get('word_count', 0)
-            processed_date = summary_data.get('processed_date', 'Unknown')
-            
-            html_content += f"""
-    <div class="summary-item" id="item{i}">
-        <h2>{i}. {title}</h2>
-        <p class="url"><strong>🔗 Link:</strong> <a href="{url}" target="_blank">{url}</a></p>
-        <p><strong>📝 Summary:</strong></p>
-        <p>{summary}</p>
-"""
-            
-            if tags:
-                html_content += f'        <p class="tags"><strong>🏷️ Tags:</strong> {", ".join(tags)}</p>\n'
-            
-            html_content += f"""        <p class="meta">
-            <strong>📊 Length:</strong> {word_count:,} words | 
-            <strong>⏰ Processed:</strong> {processed_date}
-        </p>
-    </div>
-"""
-            
-        except Exception as e:
-            continue
-    
-    html_content += """
+""")
+        
+        # Add detailed summaries
+        for i, fields in records:
+            try:
+                f.write(_render_html_item(i, fields))
+            except Exception:
+                continue
+        
+        f.write("""
     <footer style="margin-top: 50px; padding-top: 20px; border-top: 1px solid #bdc3c7; text-align: center; color: #7f8c8d;">
         <p>Generated by AI Link Scraper Bot 🤖</p>
     </footer>
 </body>
 </html>
-"""
-    
-    # Write HTML file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_filename = f"weekly_summary_{start_date.strftime('%Y%m%d')}_{timestamp}.html"
-    output_path = summaries_path.parent / output_filename
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+""")
     
     return str(output_path)
@@ -12,8 +12,13 @@ import sys
 import os
 import csv
 import json
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import chain, zip_longest
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Ensure project root is in sys.path for imports
 project_root = os.path.dirname(os.path.dirname(__file__))
@@ -29,6 +34,12 @@ class DailyDataUpdater:
     
     def __init__(self):
         self.master_data_file = os.path.join(project_root, "master_links_data.csv")
+        # Whether the master file already has its header row, checked once here
+        # rather than on every append
+        self._header_written = os.path.exists(self.master_data_file)
+        # URLs already in the master file, indexed so new-link checks don't re-read the CSV
+        self.url_index_file = os.path.join(project_root, "_url_index.sqlite")
+        self._url_index_conn = None
         self.slack_client = SlackClient()
         self.web_scraper = WebScraper()
         self.summarizer = Summarizer()
@@ -77,43 +88,68 @@ class DailyDataUpdater:
             
         print(f"🆕 Processing {len(new_links)} new links...")
         
-        # Process new links
-        processed_count = 0
-        for i, link_data in enumerate(new_links, 1):
-            try:
-                print(f"📄 Processing {i}/{len(new_links)}: {link_data.get('url', 'Unknown')}")
+        # Scrape and summarize in parallel; results are collected on this thread
+        # and appended to the master file in one write
+        processed_rows = []
+        try:
+            self._process_new_links(new_links, target_date, processed_rows)
+        finally:
+            self._append_batch_to_master_file(processed_rows)
                 
-                # Scrape content
-                content_data = self.web_scraper.scrape_url(link_data['url'])
+        print(f"✅ Slack update complete: {len(processed_rows)} new links processed")
+        return len(processed_rows)
+
+    def _process_new_links(self, new_links, target_date, processed_rows):
+        """Scrape and summarize new links, appending each successful result to processed_rows"""
+        with ThreadPoolExecutor(max_workers=settings.SCRAPE_WORKERS) as executor:
+            futures = {
+                executor.submit(self._process_one, link_data, target_date): link_data
+                for link_data in self._interleave_by_domain(new_links)
+            }
+            
+            for i, future in enumerate(as_completed(futures), 1):
+                link_data = futures[future]
+                try:
+                    processed_link = future.result()
+                except Exception as e:
+                    print(f"❌ Error processing {link_data.get('url')}: {e}")
+                    continue
                 
-                if content_data and content_data.get('content'):
-                    # Generate summary
-                    summary = self.summarizer.summarize_content(
-                        content_data['content'],
-                        max_length=settings.SUMMARY_MAX_LENGTH
-                    )
-                    content_data['summary'] = summary
-                    
-                    # Combine data
-                    processed_link = {**link_data, **content_data}
-                    processed_link['date_processed'] = target_date.isoformat()
-                    processed_link['processing_date'] = datetime.now().isoformat()
-                    
-                    # Add to master file
-                    self._add_to_master_file(processed_link)
-                    processed_count += 1
-                    
-                    print(f"✅ Processed: {processed_link.get('title', 'Unknown')}")
+                if processed_link:
+                    processed_rows.append(processed_link)
+                    print(f"✅ Processed {i}/{len(new_links)}: {processed_link.get('title', 'Unknown')}")
                 else:
-                    print(f"⚠️ Failed to scrape: {link_data.get('url')}")
-                    
-            except Exception as e:
-                print(f"❌ Error processing {link_data.get('url')}: {e}")
-                continue
-                
-        print(f"✅ Slack update complete: {processed_count} new links processed")
-        return processed_count
+                    print(f"⚠️ Failed to scrape {i}/{len(new_links)}: {link_data.get('url')}")
+        
+    def _process_one(self, link_data, target_date):
+        """Scrape and summarize one link, returning the row to store or None if scraping failed"""
+        print(f"📄 Processing: {link_data.get('url', 'Unknown')}")
+        
+        # Scrape content
+        content_data = self.web_scraper.scrape_url(link_data['url'])
+        if not content_data or not content_data.get('content'):
+            return None
         
+        # Generate summary
+        content_data['summary'] = self.summarizer.summarize_content(
+            content_data['content'],
+            content_data.get('title'),
+            link_data['url']
+        )
+        
+        # Combine data
+        processed_link = {**link_data, **content_data}
+        processed_link['date_processed'] = target_date.isoformat()
+        processed_link['processing_date'] = datetime.now().isoformat()
+        return processed_link
+    
+    def _interleave_by_domain(self, links):
+        """Order links round-robin across domains so workers don't all hit one host at once"""
+        by_domain = defaultdict(list)
+        for link in links:
+            by_domain[urlparse(link.get('url', '')).netloc].append(link)
+        return [link for link in chain.from_iterable(zip_longest(*by_domain.values())) if link is not None]
+    
     def update_b2b_vault_daily(self, max_articles=10):
         """Update B2B Vault with a small daily batch"""
         print("🔄 Starting daily B2B Vault update...")
@@ -134,8 +170,8 @@ class DailyDataUpdater:
             )
             
             if articles:
-                # Process articles with AI
-                processed_articles = agent.process_multiple_articles(articles, preview=False)
+                # Process articles with AI, scraping the next while the previous is analyzed
+                processed_articles = agent.process_multiple_articles_pipelined(articles, preview=False)
                 
                 if processed_articles:
                     # Save to database
@@ -156,18 +192,72 @@ class DailyDataUpdater:
             print(f"❌ Error updating B2B Vault: {e}")
             return 0
             
+    def _url_index(self):
+        """Connection to the processed-URL index, rebuilt from the master file when out of date
+        
+        The index records the master file's size and mtime as of its last
+        update. If the file has since been removed, replaced or appended to
+        without the index (a crash between the two writes), the recorded
+        signature no longer matches and the URLs are reloaded from the CSV,
+        which stays the source of truth.
+        """
+        if self._url_index_conn is None:
+            conn = sqlite3.connect(self.url_index_file)
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY)")
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                row = conn.execute("SELECT value FROM meta WHERE key = 'master_signature'").fetchone()
+                if (row[0] if row else None) != self._master_signature():
+                    self._rebuild_url_index(conn)
+            self._url_index_conn = conn
+        return self._url_index_conn
+    
+    def _master_signature(self):
+        """'size:mtime' of the master file, or None if it doesn't exist"""
+        try:
+            stat = os.stat(self.master_data_file)
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _record_master_signature(self, conn):
+        """Remember the master file's current signature (inside the caller's transaction)"""
+        signature = self._master_signature()
+        if signature is None:
+            conn.execute("DELETE FROM meta WHERE key = 'master_signature'")
+        else:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('master_signature', ?)", (signature,))
+    
+    def _rebuild_url_index(self, conn):
+        """Replace the indexed URLs with those in the master file (inside the caller's transaction)"""
+        conn.execute("DELETE FROM urls")
+        if os.path.exists(self.master_data_file):
+            with open(self.master_data_file, 'r', newline='', encoding='utf-8') as f:
+                # Project just the url column instead of building a dict per row
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if 'url' in header:
+                    url_idx = header.index('url')
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO urls (url) VALUES (?)",
+                        ((row[url_idx],) for row in reader if len(row) > url_idx and row[url_idx])
+                    )
+        self._record_master_signature(conn)
+    
     def _filter_new_links(self, links_data):
         """Filter out links that have already been processed"""
-        if not os.path.exists(self.master_data_file):
-            return links_data
-            
         try:
+            conn = self._url_index()
+            candidate_urls = list({link.get('url') for link in links_data if link.get('url')})
+            
+            # Look candidates up in chunks that stay under SQLite's parameter limit
             existing_urls = set()
-            with open(self.master_data_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if 'url' in row:
-                        existing_urls.add(row['url'])
+            for start in range(0, len(candidate_urls), 500):
+                chunk = candidate_urls[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                existing_urls.update(
+                    url for (url,) in conn.execute(f"SELECT url FROM urls WHERE url IN ({placeholders})", chunk)
+                )
                         
             new_links = [link for link in links_data if link.get('url') not in existing_urls]
             print(f"🔍 Filtered out {len(links_data) - len(new_links)} already processed links")
@@ -177,10 +267,11 @@ class DailyDataUpdater:
             print(f"⚠️ Error filtering links: {e}")
             return links_data
             
-    def _add_to_master_file(self, processed_link):
-        """Add a single processed link to the master CSV file"""
-        file_exists = os.path.exists(self.master_data_file)
-        
+    def _append_batch_to_master_file(self, processed_links):
+        """Append processed links to the master CSV file in a single write"""
+        if not processed_links:
+            return
+            
         headers = [
             'title', 'url', 'domain', 'content_type', 'word_count',
             'date_shared', 'shared_by', 'summary', 'content',
@@ -190,14 +281,20 @@ class DailyDataUpdater:
         with open(self.master_data_file, 'a', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=headers)
             
-            if not file_exists:
+            if not self._header_written:
                 writer.writeheader()
+                self._header_written = True
                 
             # Ensure all fields exist
-            row = {}
-            for header in headers:
-                row[header] = processed_link.get(header, '')
-            writer.writerow(row)
+            writer.writerows(
+                {header: processed_link.get(header, '') for header in headers}
+                for processed_link in processed_links
+            )
+        
+        urls = [(link['url'],) for link in processed_links if link.get('url')]
+        with self._url_index() as conn:
+            conn.executemany("INSERT OR IGNORE INTO urls (url) VALUES (?)", urls)
+            self._record_master_signature(conn)
             
     def _save_b2b_articles(self, articles):
         """Save B2B articles to database"""
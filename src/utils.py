@@ -1,7 +1,9 @@
+import html
 import re
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
 
 def setup_logging(log_level="INFO", log_file="logs/app.log"):
@@ -21,60 +23,38 @@ def setup_logging(log_level="INFO", log_file="logs/app.log"):
     )
     return logging.getLogger(__name__)
 
+# A URL runs until whitespace or a character that can't appear unescaped in
+# one; Slack's surrounding angle brackets and |label suffix are excluded
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Trailing punctuation and quotes that belong to the sentence, not the URL
+_URL_TRAILING_RE = re.compile(r'[>|)\].,:;!?\'"]+$')
+
+# Non-content hosts (and their subdomains) whose links are never summarized
+_SKIP_DOMAIN_RE = re.compile(r'(?:^|\.)(?:slack\.com|tenor\.com|giphy\.com|t\.co)$')
+
+# Slack's own short links live under a path on bit.ly, so they're matched by prefix
+_SKIP_URL_PREFIXES = ('https://bit.ly/slack', 'http://bit.ly/slack')
+
 def extract_urls_from_text(text):
-    """Extract URLs from text using improved regex patterns"""
+    """Extract URLs from text, in order of first appearance and without duplicates"""
     if not text:
         return []
     
-    # Multiple patterns to catch different URL formats
-    patterns = [
-        # Standard HTTP/HTTPS URLs
-        r'https?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-        # URLs wrapped in angle brackets (common in Slack)
-        r'<(https?://[^>]+)>',
-        # URLs with special characters that might be escaped
-        r'https?://[^\s<>"{}|\\^`\[\]]+',
-    ]
-    
-    urls = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        if isinstance(matches[0], tuple) if matches else False:
-            # Extract from capturing groups
-            urls.extend([match[0] if isinstance(match, tuple) else match for match in matches])
-        else:
-            urls.extend(matches)
-    
-    # Clean up URLs
-    cleaned_urls = []
-    for url in urls:
-        # Remove Slack formatting and trailing punctuation
-        url = re.sub(r'^<|>$', '', url)  # Remove angle brackets
-        url = re.sub(r'[>\|\)\]\.,:;!?]+$', '', url)  # Remove trailing punctuation
-        url = re.sub(r'["\']$', '', url)  # Remove trailing quotes
-        
-        # Skip empty URLs
-        if not url or len(url) < 10:
-            continue
-            
-        cleaned_urls.append(url)
-    
-    # Remove duplicates while preserving order
-    unique_urls = []
-    seen = set()
-    for url in cleaned_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+    # Clean up URLs, skipping anything too short to be a real link, and
+    # remove duplicates while preserving order
+    unique_urls = dict.fromkeys(
+        url for url in (_URL_TRAILING_RE.sub('', match) for match in _URL_RE.findall(text))
+        if len(url) >= 10
+    )
     
     # Filter out common non-content URLs
     filtered_urls = []
-    skip_domains = ['slack.com', 'tenor.com', 'giphy.com', 't.co', 'bit.ly/slack']
     
     for url in unique_urls:
         try:
-            domain = urlparse(url).netloc.lower()
-            if not any(skip_domain in domain for skip_domain in skip_domains):
+            domain = urlparse(url).hostname or ''
+            if not _SKIP_DOMAIN_RE.search(domain) and not url.startswith(_SKIP_URL_PREFIXES):
                 filtered_urls.append(url)
         except:
             # If URL parsing fails, skip it
@@ -82,43 +62,55 @@ def extract_urls_from_text(text):
     
     return filtered_urls
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def clean_text(text):
     """Clean and normalize text content"""
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove common HTML entities
-    html_entities = {
-        '&nbsp;': ' ',
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'"
-    }
-    
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
-    
-    return text
+    # Decode HTML entities (named and numeric), then collapse whitespace;
+    # this order also turns &nbsp; into a plain space
+    text = html.unescape(text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+# Characters that are unsafe in file names, each mapped to an underscore
+_UNSAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
 
 def sanitize_filename(filename):
     """Sanitize filename for safe file system usage"""
-    # Remove or replace unsafe characters
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
+    # Replace unsafe characters in a single pass
+    filename = filename.translate(_UNSAFE_FILENAME_TABLE)
     
     # Limit length and remove leading/trailing periods
     filename = filename.strip('.')[:200]
     
     return filename if filename else 'unnamed_link'
 
+# Append-only (file name, mtime) log kept next to saved summaries, so date
+# range lookups don't need to stat every file in the folder
+SUMMARY_INDEX_FILE = ".index.jsonl"
+
+def dated_summary_files(summaries_path):
+    """(mtime, path) for every .json file in the folder, from a single directory scan
+    
+    os.scandir returns the entries with their names, and on platforms that
+    report it the stat data too, without a separate lookup per file.
+    """
+    import os
+    
+    dated_files = []
+    with os.scandir(summaries_path) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                try:
+                    dated_files.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    return dated_files
+
 def save_summary_to_file(summary_data, output_folder):
-    """Save summary data to JSON file"""
+    """Save summary data to JSON file, recording it in the folder's index"""
     import os
     
     # Ensure output folder exists
@@ -135,43 +127,69 @@ def save_summary_to_file(summary_data, output_folder):
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(summary_data, f, indent=2, ensure_ascii=False)
     
+    append_to_summary_index(output_folder, [(filename, os.path.getmtime(filepath))])
+    
     return filepath
 
+def append_to_summary_index(output_folder, entries):
+    """Append (file name, mtime) pairs to the folder's summary index
+    
+    The first write to a folder without an index seeds it with every summary
+    already there, so lookups never read an index that misses older files.
+    """
+    import os
+    
+    index_path = os.path.join(output_folder, SUMMARY_INDEX_FILE)
+    if not os.path.exists(index_path):
+        seeded = {os.path.basename(path): mtime for mtime, path in dated_summary_files(output_folder)}
+        seeded.update(entries)
+        entries = seeded.items()
+    
+    lines = "".join(json.dumps({"f": name, "t": mtime}) + "\n" for name, mtime in entries)
+    with open(index_path, 'a', encoding='utf-8') as f:
+        f.write(lines)
+
 def format_summary_data(url, title, summary, slack_message_id=None, word_count=0, tags=None):
     """Format summary data into standard structure"""
+    # One clock reading so the three time fields always agree
+    now = datetime.now()
     return {
         "url": url,
         "title": title or "No Title",
         "summary": summary,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "slack_message_id": slack_message_id,
         "word_count": word_count,
         "tags": tags or [],
-        "processed_date": datetime.now().strftime("%Y-%m-%d"),
-        "processed_time": datetime.now().strftime("%H:%M:%S")
+        "processed_date": f"{now.year:04d}-{now.month:02d}-{now.day:02d}",
+        "processed_time": f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
     }
 
+@lru_cache(maxsize=4096)
+def ts_to_datetime(ts_float):
+    """Convert a Slack message timestamp to a local datetime (cached per timestamp)"""
+    return datetime.fromtimestamp(ts_float)
+
 def is_valid_url(url):
-    """Check if URL is valid and accessible"""
-    try:
-        parsed = urlparse(url)
-        return all([parsed.scheme, parsed.netloc])
-    except Exception:
+    """Check if URL is an http(s) link with a dotted host name"""
+    if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
         return False
+    
+    # Host is everything after the scheme up to the path, query or fragment
+    rest = url.split('://', 1)[1]
+    host = rest.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0]
+    return bool(host) and '.' in host
 
 def truncate_text(text, max_length):
     """Truncate text to specified length while preserving sentence boundaries"""
     if len(text) <= max_length:
         return text
     
-    # First try to find the last complete sentence within the limit
-    sentence_endings = ['.', '!', '?']
-    
-    # Look for sentence endings within the max_length
-    for i in range(max_length, 0, -1):
-        if i < len(text) and text[i] in sentence_endings:
-            # Found a sentence ending, return text up to and including it
-            return text[:i+1]
+    # First try to find the last complete sentence within the limit,
+    # returning text up to and including its ending
+    end = max(text.rfind('.', 1, max_length), text.rfind('!', 1, max_length), text.rfind('?', 1, max_length))
+    if end > 0:
+        return text[:end+1]
     
     # If no sentence ending found, find the last space before the max length
     # and don't add "..." to avoid incomplete sentences
@@ -1,12 +1,45 @@
 import json
 import os
 import threading
-from typing import Dict
+from typing import Dict, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Logged votes to accumulate before folding them into the snapshot file
+LOG_COMPACT_THRESHOLD = 1000
+
+def _dumps(obj) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _loads(raw: bytes):
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
 class VotingSystem:
+    """Per-article up/down votes, one vote per user.
+
+    Each article keeps the sets of users who voted up and down. votes.json
+    holds a snapshot; each vote is appended as one line to a log beside it
+    (votes.log) instead of rewriting the snapshot, and the log is folded
+    back into the snapshot every LOG_COMPACT_THRESHOLD votes.
+    """
+
     def __init__(self, votes_file: str = "votes.json"):
         self.votes_file = votes_file
+        self.log_file = os.path.splitext(votes_file)[0] + ".log"
         self.lock = threading.Lock()
+        # Parsed votes and the file signature they were read at; reloaded
+        # only when another process has changed the files
+        self._cache = None
+        self._signature = None
+        self._log_entries = 0
+        # Set when the log ends in a partial line, so the next append starts a fresh one
+        self._log_needs_newline = False
         self._ensure_votes_file()
 
     def _ensure_votes_file(self):
@@ -14,67 +47,148 @@ class VotingSystem:
             with open(self.votes_file, "w", encoding="utf-8") as f:
                 json.dump({}, f)
 
+    def _file_signature(self):
+        stat = os.stat(self.votes_file)
+        try:
+            log_size = os.stat(self.log_file).st_size
+        except FileNotFoundError:
+            log_size = 0
+        return stat.st_mtime_ns, stat.st_size, log_size
+
     def _load_votes(self) -> Dict:
-        with self.lock:
-            with open(self.votes_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+        """Current votes, from memory unless the files changed on disk (caller holds the lock)"""
+        signature = self._file_signature()
+        if self._cache is None or signature != self._signature:
+            with open(self.votes_file, "rb") as f:
+                votes = {url: self._decode_article(article) for url, article in _loads(f.read()).items()}
+            self._log_entries = self._replay_log(votes)
+            self._cache = votes
+            self._signature = signature
+        return self._cache
+
+    @staticmethod
+    def _decode_article(article: Dict) -> Dict:
+        """Snapshot entry to in-memory voter sets, accepting the older voters-dict layout"""
+        if "voters" in article:
+            voters = article["voters"]
+            return {
+                "up": {user for user, vote in voters.items() if vote == "upvote"},
+                "down": {user for user, vote in voters.items() if vote == "downvote"}
+            }
+        return {"up": set(article.get("up", ())), "down": set(article.get("down", ()))}
+
+    def _replay_log(self, votes: Dict) -> int:
+        """Apply logged votes on top of the snapshot, returning how many were read"""
+        try:
+            with open(self.log_file, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return 0
+        self._log_needs_newline = bool(raw) and not raw.endswith(b"\n")
+        lines = raw.splitlines()
+        for line in lines:
+            try:
+                entry = _loads(line)
+            except ValueError:
+                # Blank, or a partial line from an interrupted append
+                continue
+            self._set_vote(votes, entry["a"], entry["u"], entry["v"])
+        return len(lines)
+
+    @staticmethod
+    def _set_vote(votes: Dict, article_url: str, user_id: str, vote_type: Optional[str]):
+        """Make vote_type (or no vote, for None) the user's current vote on an article"""
+        article = votes.setdefault(article_url, {"up": set(), "down": set()})
+        article["up"].discard(user_id)
+        article["down"].discard(user_id)
+        if vote_type == "upvote":
+            article["up"].add(user_id)
+        elif vote_type == "downvote":
+            article["down"].add(user_id)
+
+    def _log_vote(self, votes: Dict, article_url: str, user_id: str, vote_type: Optional[str]):
+        """Record a vote in the log, compacting it into the snapshot when it grows (caller holds the lock)"""
+        line = _dumps({"a": article_url, "u": user_id, "v": vote_type}) + b"\n"
+        if self._log_needs_newline:
+            line = b"\n" + line
+            self._log_needs_newline = False
+        with open(self.log_file, "ab") as f:
+            f.write(line)
+        self._log_entries += 1
+        if self._log_entries >= LOG_COMPACT_THRESHOLD:
+            self._save_votes(votes)
+        else:
+            self._signature = self._file_signature()
 
     def _save_votes(self, votes: Dict):
-        with self.lock:
-            with open(self.votes_file, "w", encoding="utf-8") as f:
-                json.dump(votes, f, indent=2)
+        """Write a full snapshot and clear the log (caller holds the lock)"""
+        raw = _dumps({
+            url: {"up": list(article["up"]), "down": list(article["down"])}
+            for url, article in votes.items()
+        })
+        # Write beside the target and rename over it, so readers and crashes
+        # never see a half-written file
+        tmp_file = f"{self.votes_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_file, self.votes_file)
+        # Log entries set a user's final vote, so replaying any left behind by
+        # a crash here over the new snapshot is harmless
+        try:
+            os.remove(self.log_file)
+        except FileNotFoundError:
+            pass
+        self._log_entries = 0
+        self._log_needs_newline = False
+        self._cache = votes
+        self._signature = self._file_signature()
 
     def vote(self, article_url: str, vote_type: str, user_id: str) -> Dict:
         if vote_type not in ("upvote", "downvote"):
             return {"success": False, "error": "Invalid vote type"}
-        votes = self._load_votes()
-        if article_url not in votes:
-            votes[article_url] = {"upvotes": 0, "downvotes": 0, "voters": {}}
-        article = votes[article_url]
-        action = "added"
-        if user_id in article["voters"]:
-            prev = article["voters"][user_id]
-            if prev == vote_type:
-                # Remove vote
-                article[prev + "s"] -= 1
-                del article["voters"][user_id]
-                action = "removed"
-            else:
-                # Change vote
-                article[prev + "s"] -= 1
-                article[vote_type + "s"] += 1
-                article["voters"][user_id] = vote_type
-                action = "changed"
+        with self.lock:
+            return self._apply_vote(self._load_votes(), article_url, vote_type, user_id)
+
+    def _apply_vote(self, votes: Dict, article_url: str, vote_type: str, user_id: str) -> Dict:
+        article = votes.setdefault(article_url, {"up": set(), "down": set()})
+        same, other = (article["up"], article["down"]) if vote_type == "upvote" else (article["down"], article["up"])
+        if user_id in same:
+            # Remove vote
+            same.remove(user_id)
+            new_vote, action = None, "removed"
+        elif user_id in other:
+            # Change vote
+            other.remove(user_id)
+            same.add(user_id)
+            new_vote, action = vote_type, "changed"
         else:
-            article[vote_type + "s"] += 1
-            article["voters"][user_id] = vote_type
-        self._save_votes(votes)
+            same.add(user_id)
+            new_vote, action = vote_type, "added"
+        self._log_vote(votes, article_url, user_id, new_vote)
+        upvotes, downvotes = len(article["up"]), len(article["down"])
         return {
             "success": True,
             "action": action,
-            "upvotes": article["upvotes"],
-            "downvotes": article["downvotes"],
-            "score": article["upvotes"] - article["downvotes"]
+            "upvotes": upvotes,
+            "downvotes": downvotes,
+            "score": upvotes - downvotes
         }
 
-    def get_votes(self, article_url: str) -> Dict:
-        votes = self._load_votes()
-        article = votes.get(article_url, {"upvotes": 0, "downvotes": 0, "voters": {}})
+    @staticmethod
+    def _tally(article: Optional[Dict]) -> Dict:
+        upvotes = len(article["up"]) if article else 0
+        downvotes = len(article["down"]) if article else 0
         return {
-            "upvotes": article["upvotes"],
-            "downvotes": article["downvotes"],
-            "score": article["upvotes"] - article["downvotes"],
-            "total_votes": article["upvotes"] + article["downvotes"]
+            "upvotes": upvotes,
+            "downvotes": downvotes,
+            "score": upvotes - downvotes,
+            "total_votes": upvotes + downvotes
         }
 
+    def get_votes(self, article_url: str) -> Dict:
+        with self.lock:
+            return self._tally(self._load_votes().get(article_url))
+
     def get_all_votes(self) -> Dict:
-        votes = self._load_votes()
-        result = {}
-        for url, article in votes.items():
-            result[url] = {
-                "upvotes": article["upvotes"],
-                "downvotes": article["downvotes"],
-                "score": article["upvotes"] - article["downvotes"],
-                "total_votes": article["upvotes"] + article["downvotes"]
-            }
-        return result
+        with self.lock:
+            return {url: self._tally(article) for url, article in self._load_votes().items()}
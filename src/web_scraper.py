@@ -1,16 +1,204 @@
+import hashlib
+import json
 import logging
+import re
 import requests
+import sqlite3
+import threading
 import time
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, zip_longest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from config.settings import settings
 
+try:
+    import lxml  # noqa: F401 - only checked for availability, used through BeautifulSoup
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# lxml's C parser builds the tree several times faster than the pure-Python one
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Connection pool sizing: hosts kept and keep-alive connections per host, enough
+# for every worker thread to hold its own connection
+POOL_CONNECTIONS = 50
+POOL_MAXSIZE = 50
+
+# Responses worth retrying; other HTTP errors (404, 403, ...) fail immediately
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Response types worth parsing, and the most of a page body that is read
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# Seconds a cached scrape is reused without asking the server; after that the
+# page is revalidated with a conditional GET
+SCRAPE_CACHE_TTL = 24 * 3600
+
+# Default seconds between requests to the same host
+MIN_HOST_INTERVAL = 1
+
+# Formatting artifacts removed from extracted text, in one character class:
+# zero-width characters (U+200B-U+200F), arrows, box drawing, block elements,
+# geometric shapes, miscellaneous symbols, dingbats and the byte order mark
+_ARTIFACT_CHARS_RE = re.compile(r'[\u200B-\u200F\u2190-\u21FF\u2500-\u27BF\uFEFF]')
+
+# Whitespace and sentence spacing fixes applied by _clean_text, in order
+_SPACES_RE = re.compile(r'[ \t]+')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+_SENTENCE_NEWLINE_RE = re.compile(r'([.!?])\s*\n([A-Z])')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.!?,:;])')
+_SENTENCE_SPACE_RE = re.compile(r'([.!?])\s*([A-Z])')
+
+# Spacing fixes applied by _extract_structured_text
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+_PERIOD_CAPITAL_RE = re.compile(r'\.([A-Z])')
+_LIST_ITEM_END_RE = re.compile(r'(\n•[^\n]+)\n([^•\n])')
+
+# Page chrome removed before content extraction: these tags, and block
+# containers with one of these class names. Classes must match whole and
+# inline elements are left alone, since names like "sidebar-visible" sit on
+# <html>/<body> and heading anchors are often class="header"
+_UNWANTED_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement', 'ads']
+_UNWANTED_CLASS_RE = re.compile(r'^(?:ad|ads|advertisement|sidebar|menu|navigation|footer|header)$', re.IGNORECASE)
+_CHROME_CONTAINER_TAGS = ['div', 'section', 'ul', 'ol', 'ins', 'iframe']
+
+# Title sources in order of preference, and main content containers (the
+# longest match wins), as (tag, attrs) pairs for find(), which skips
+# select_one's CSS parsing; a class attr matches any of an element's classes
+_TITLE_SOURCES = (
+    ('meta', {'property': 'og:title'}),
+    ('meta', {'name': 'twitter:title'}),
+    ('title', {}),
+    ('h1', {})
+)
+_CONTENT_SELECTORS = (
+    ('article', {}),
+    ('main', {}),
+    (None, {'role': 'main'}),
+    (None, {'class': 'post-content'}),
+    (None, {'class': 'entry-content'}),
+    (None, {'class': 'article-body'}),
+    (None, {'class': 'story-body'}),
+    (None, {'class': 'content'}),
+    (None, {'class': 'main-content'}),
+    (None, {'class': 'article-content'}),
+    (None, {'class': 'post-body'}),
+    (None, {'class': 'blog-content'}),
+    (None, {'class': 'markdown-body'}),      # GitHub
+    (None, {'class': 'readme'}),             # GitHub README
+    (None, {'class': 'discussion-content'}), # Forums
+    (None, {'class': 'message-content'})     # Forums/discussions
+)
+# Text-bearing tags gathered when no content container matched
+_FALLBACK_CONTENT_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote', 'pre', 'code']
+
+@lru_cache(maxsize=4096)
+def _site_domain(url):
+    """Lowercase host name of a URL without a leading www. (cached per URL)"""
+    try:
+        host = urlparse(url).hostname or ''
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
+
+def _on_any_site(domain, sites):
+    """Whether domain is one of the sites or a subdomain of one, via a set lookup per suffix"""
+    labels = domain.split('.')
+    return any('.'.join(labels[i:]) in sites for i in range(len(labels) - 1))
+
+class ScrapeCache:
+    """Successful scrape results keyed by a SHA-256 of the canonical URL, stored in SQLite
+    
+    Each entry keeps the page's ETag / Last-Modified, so once it is older
+    than ttl seconds it can be revalidated with a conditional GET instead
+    of downloaded and parsed again.
+    """
+    
+    def __init__(self, path, ttl=SCRAPE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, fetched REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def key(url):
+        """Stable hash of a URL, ignoring the fragment and scheme/host case"""
+        parsed = urlparse(url)
+        canonical = parsed._replace(
+            scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment=''
+        ).geturl()
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, url):
+        """Cached entry for url as a dict (result, etag, last_modified, fresh), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, etag, last_modified, fetched FROM pages WHERE key = ?", (self.key(url),)
+            ).fetchone()
+        if not row:
+            return None
+        result, etag, last_modified, fetched = row
+        return {
+            'result': json.loads(result),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': time.time() - fetched < self.ttl
+        }
+    
+    def set(self, url, result, etag=None, last_modified=None):
+        """Store a successful scrape result with the validators it was served with"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, result, etag, last_modified, fetched) VALUES (?, ?, ?, ?, ?)",
+                (self.key(url), json.dumps(result), etag, last_modified, time.time())
+            )
+            self._conn.commit()
+    
+    def touch(self, url):
+        """Mark an entry fresh again after the server confirmed it unchanged"""
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched = ? WHERE key = ?", (time.time(), self.key(url)))
+            self._conn.commit()
+
 class WebScraper:
-    def __init__(self):
-        """Initialize web scraper with configuration"""
-        self.session = requests.Session()
+    def __init__(self, session=None, cache_file=settings.SCRAPE_CACHE_FILE):
+        """Initialize web scraper with configuration
+        
+        Pass a requests.Session to share one connection pool between scrapers,
+        and cache_file=None to scrape without the persistent result cache.
+        """
+        self.timeout = settings.REQUEST_TIMEOUT
+        self.max_retries = settings.MAX_RETRIES
+        self.cache = ScrapeCache(cache_file) if cache_file else None
+        
+        if session is None:
+            session = requests.Session()
+            # Connection errors and transient statuses are retried by the
+            # adapter with exponential backoff, reusing pooled connections
+            retry = Retry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=1,
+                status_forcelist=RETRY_STATUS_CODES,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
         self.session.headers.update({
             'User-Agent': settings.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -18,8 +206,12 @@ class WebScraper:
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         })
-        self.timeout = settings.REQUEST_TIMEOUT
-        self.max_retries = settings.MAX_RETRIES
+        
+        # Earliest time (time.monotonic) each host may be requested again,
+        # shared by every thread using this scraper
+        self.min_host_interval = MIN_HOST_INTERVAL
+        self._host_lock = threading.Lock()
+        self._host_next_slot = {}
         
         # Sites that require JavaScript or have special handling
         self.js_dependent_sites = {
@@ -42,35 +234,15 @@ class WebScraper:
     
     def _is_js_dependent_site(self, url):
         """Check if URL is from a JavaScript-dependent site"""
-        try:
-            domain = urlparse(url).netloc.lower()
-            # Remove www. prefix if present
-            domain = domain.replace('www.', '')
-            
-            for js_site in self.js_dependent_sites:
-                if js_site in domain:
-                    return True
-            return False
-        except:
-            return False
+        return _on_any_site(_site_domain(url), self.js_dependent_sites)
     
     def _needs_anti_blocking(self, url):
         """Check if URL is from a site that commonly blocks scrapers"""
-        try:
-            domain = urlparse(url).netloc.lower()
-            # Remove www. prefix if present
-            domain = domain.replace('www.', '')
-            
-            for block_site in self.anti_block_sites:
-                if block_site in domain:
-                    return True
-            return False
-        except:
-            return False
+        return _on_any_site(_site_domain(url), self.anti_block_sites)
     
     def _get_enhanced_headers(self, url, attempt=0):
         """Get enhanced headers for anti-blocking"""
-        domain = urlparse(url).netloc.lower()
+        domain = _site_domain(url)
         
         headers = {
             'User-Agent': self.user_agents[attempt % len(self.user_agents)],
@@ -88,7 +260,7 @@ class WebScraper:
         }
         
         # Add referer for certain sites
-        if 'businesswire.com' in domain:
+        if _on_any_site(domain, {'businesswire.com'}):
             headers['Referer'] = 'https://www.google.com/'
             
         return headers
@@ -107,10 +279,13 @@ class WebScraper:
         
         page_text = soup.get_text().lower()
         
-        for indicator in js_indicators:
-            if indicator in page_text:
-                logger.warning(f"JavaScript required for {url} - detected: '{indicator}'")
-                return True
+        # Every indicator mentions javascript, so one scan for the word rules
+        # out most pages before the individual phrases are searched
+        if 'javascript' in page_text:
+            for indicator in js_indicators:
+                if indicator in page_text:
+                    logger.warning(f"JavaScript required for {url} - detected: '{indicator}'")
+                    return True
         
         # Check if page has very little content (common for JS-dependent sites)
         if len(page_text.strip()) < 200 and self._is_js_dependent_site(url):
@@ -119,169 +294,215 @@ class WebScraper:
             
         return False
     
-    def scrape_url(self, url):
-        """Scrape content from a single URL"""
+    def scrape_url(self, url, min_interval=None):
+        """Scrape content from a single URL
+        
+        Requests to one host, from any thread, are spaced at least
+        min_interval seconds apart (default self.min_host_interval); cached
+        results don't wait.
+        """
+        if min_interval is None:
+            min_interval = self.min_host_interval
         try:
-            logger.info(f"Scraping URL: {url}")
-            
-            # Check if this is a known JS-dependent site
-            if self._is_js_dependent_site(url):
-                logger.info(f"Detected JavaScript-dependent site: {url}")
-                # Use more sophisticated headers for social media
-                original_user_agent = self.session.headers.get('User-Agent')
-                self.session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                })
-            
-            # Get the webpage content
-            response = self._fetch_with_retry(url)
-            if not response:
-                return None
+            cached = self.cache.get(url) if self.cache else None
+            if cached and cached['fresh']:
+                logger.info(f"Using cached scrape for {url}")
+                return {**cached['result'], 'url': url}
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Check if JavaScript is required
-            if self._detect_js_requirement(soup, url):
-                # Restore original user agent
-                if self._is_js_dependent_site(url):
-                    self.session.headers['User-Agent'] = original_user_agent
-                
-                # Return a special result indicating JS dependency
-                return {
-                    'url': url,
-                    'title': 'JavaScript Required',
-                    'content': f'This content from {urlparse(url).netloc} requires JavaScript to load properly. The scraper cannot access the full content from this social media or dynamic website.',
-                    'word_count': 0,
-                    'status': 'js_required',
-                    'domain': urlparse(url).netloc
-                }
-            
-            # Extract content
-            title = self._extract_title(soup)
-            content = self._extract_main_content(soup)
-            
-            # Restore original user agent
-            if self._is_js_dependent_site(url):
-                self.session.headers['User-Agent'] = original_user_agent
+            logger.info(f"Scraping URL: {url}")
             
-            if not content:
-                logger.warning(f"No content extracted from {url}")
+            # Get the webpage content, conditionally if we hold an older copy
+            fetched = self._fetch_with_retry(
+                url, self._site_headers(url), self._conditional_headers(cached), min_interval
+            )
+            if not fetched:
                 return None
             
-            result = {
-                'url': url,
-                'title': title,
-                'content': content,
-                'word_count': len(content.split()),
-                'status': 'success'
-            }
+            content, response_headers = fetched
+            if content is None:
+                logger.info(f"{url} unchanged since last scrape")
+                self.cache.touch(url)
+                return {**cached['result'], 'url': url}
             
-            logger.info(f"Successfully scraped {url} - {result['word_count']} words")
-            return result
+            return self._store_result(url, self._parse_page(url, content), response_headers)
             
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            return self._error_result(url, e)
+    
+    @staticmethod
+    def _conditional_headers(cached):
+        """If-None-Match / If-Modified-Since headers revalidating a cache entry, or None"""
+        if not cached:
+            return None
+        headers = {}
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers or None
+    
+    def _store_result(self, url, result, response_headers):
+        """Write a successful scrape through to the cache, returning the result unchanged"""
+        if self.cache and result and result['status'] == 'success':
+            self.cache.set(url, result, response_headers.get('ETag'), response_headers.get('Last-Modified'))
+        return result
+    
+    def _site_headers(self, url):
+        """Extra request headers for known JS-dependent sites, or None"""
+        if not self._is_js_dependent_site(url):
+            return None
+        
+        logger.info(f"Detected JavaScript-dependent site: {url}")
+        # Use more sophisticated headers for social media (per request, so
+        # the shared session stays safe to use from several threads)
+        return {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+    
+    def _parse_page(self, url, content):
+        """Build the scrape result for a fetched page, or None if it has no usable content"""
+        # Parse the HTML
+        soup = BeautifulSoup(content, HTML_PARSER)
+        
+        # Check if JavaScript is required
+        if self._detect_js_requirement(soup, url):
+            # Return a special result indicating JS dependency
+            netloc = urlparse(url).netloc
             return {
                 'url': url,
-                'title': None,
-                'content': None,
+                'title': 'JavaScript Required',
+                'content': f'This content from {netloc} requires JavaScript to load properly. The scraper cannot access the full content from this social media or dynamic website.',
                 'word_count': 0,
-                'status': 'error',
-                'error': str(e)
+                'status': 'js_required',
+                'domain': netloc
             }
+        
+        # Extract content
+        title = self._extract_title(soup)
+        content = self._extract_main_content(soup)
+        
+        if not content:
+            logger.warning(f"No content extracted from {url}")
+            return None
+        
+        result = {
+            'url': url,
+            'title': title,
+            'content': content,
+            'word_count': len(content.split()),
+            'status': 'success'
+        }
+        
+        logger.info(f"Successfully scraped {url} - {result['word_count']} words")
+        return result
     
-    def _fetch_with_retry(self, url):
-        """Fetch URL with retry logic"""
+    def _error_result(self, url, error):
+        """Scrape result recording an unexpected error"""
+        logger.error(f"Error scraping {url}: {str(error)}")
+        return {
+            'url': url,
+            'title': None,
+            'content': None,
+            'word_count': 0,
+            'status': 'error',
+            'error': str(error)
+        }
+    
+    def _fetch_with_retry(self, url, extra_headers=None, conditional_headers=None, min_interval=0):
+        """Fetch an HTML page as (body, response headers), or None if it fails or isn't HTML
+        
+        Transient failures are retried by the session's adapter; blocking-prone
+        sites additionally get fresh browser headers on each of up to
+        max_retries attempts, since their refusals (403 etc.) aren't transient.
+        With conditional_headers, a 304 Not Modified reply gives a None body.
+        Each attempt first waits for the host's next min_interval slot.
+        """
         needs_anti_blocking = self._needs_anti_blocking(url)
+        attempts = self.max_retries if needs_anti_blocking else 1
         
-        for attempt in range(self.max_retries):
+        for attempt in range(attempts):
             try:
-                # Use enhanced headers for blocking-prone sites
-                if needs_anti_blocking:
-                    headers = self._get_enhanced_headers(url, attempt)
-                    response = requests.get(url, headers=headers, timeout=self.timeout)
-                else:
-                    response = self.session.get(url, timeout=self.timeout)
-                
-                response.raise_for_status()
-                return response
+                # Use enhanced headers for blocking-prone sites (they override
+                # the session defaults for this request only)
+                headers = self._get_enhanced_headers(url, attempt) if needs_anti_blocking else extra_headers
+                if conditional_headers:
+                    headers = {**(headers or {}), **conditional_headers}
+                self._wait_for_host(url, min_interval)
+                with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    if response.status_code == 304:
+                        return None, response.headers
+                    body = self._read_html_body(url, response)
+                    return (body, response.headers) if body else None
                 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                if attempt < self.max_retries - 1:
+                if attempt < attempts - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
-                    return None
+        
+        logger.error(f"Failed to fetch {url}")
+        return None
+    
+    def _read_html_body(self, url, response):
+        """Read a streamed response's body, skipping non-HTML and stopping at MAX_PAGE_BYTES"""
+        if not self._is_html_response(url, response.headers):
+            return None
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_BYTES):
+            if self._add_capped_chunk(url, body, chunk):
+                break
+        return bytes(body)
+    
+    @staticmethod
+    def _is_html_response(url, headers):
+        """Whether response headers allow an HTML page (a missing Content-Type is given the benefit of the doubt)"""
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            logger.warning(f"Skipping {url} - unsupported content type '{content_type}'")
+            return False
+        return True
+    
+    @staticmethod
+    def _add_capped_chunk(url, body, chunk):
+        """Append a body chunk to a bytearray, returning True once MAX_PAGE_BYTES is reached"""
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            logger.warning(f"Truncating {url} at {MAX_PAGE_BYTES} bytes")
+            del body[MAX_PAGE_BYTES:]
+            return True
+        return False
     
     def _extract_title(self, soup):
         """Extract page title from HTML"""
-        # Try different title sources in order of preference
-        title_selectors = [
-            'meta[property="og:title"]',
-            'meta[name="twitter:title"]',
-            'title',
-            'h1'
-        ]
-        
-        for selector in title_selectors:
-            if selector.startswith('meta'):
-                element = soup.select_one(selector)
-                if element:
+        for tag, attrs in _TITLE_SOURCES:
+            element = soup.find(tag, attrs)
+            if element:
+                if tag == 'meta':
                     title = element.get('content', '').strip()
-                    if title:
-                        return title
-            else:
-                element = soup.select_one(selector)
-                if element:
+                else:
                     title = element.get_text().strip()
-                    if title:
-                        return title
+                if title:
+                    return title
         
         return "No Title Found"
     
     def _extract_main_content(self, soup):
         """Extract complete main content from HTML with enhanced extraction"""
-        # Remove unwanted elements
-        unwanted_tags = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement', 'ads']
-        unwanted_classes = ['ad', 'ads', 'advertisement', 'sidebar', 'menu', 'navigation', 'footer', 'header']
-        
-        for tag in unwanted_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
-        
-        # Remove elements with unwanted classes
-        for class_name in unwanted_classes:
-            for element in soup.find_all(class_=lambda x: x and class_name in ' '.join(x).lower()):
-                element.decompose()
-        
-        # Enhanced content selectors for better extraction
-        content_selectors = [
-            'article',
-            'main', 
-            '[role="main"]',
-            '.post-content',
-            '.entry-content',
-            '.article-body',
-            '.story-body',
-            '.content',
-            '.main-content',
-            '.article-content',
-            '.post-body',
-            '.blog-content',
-            '.markdown-body',  # GitHub
-            '.readme',         # GitHub README
-            '.discussion-content', # Forums
-            '.message-content'     # Forums/discussions
-        ]
+        # Remove unwanted elements, then elements with unwanted classes, each in
+        # a single tree walk; matches nested in an already removed element are
+        # skipped
+        for matches in (soup.find_all(_UNWANTED_TAGS), soup.find_all(_CHROME_CONTAINER_TAGS, class_=_UNWANTED_CLASS_RE)):
+            for element in matches:
+                if not element.decomposed:
+                    element.decompose()
         
         best_content = ""
         best_length = 0
         
         # Try each selector and keep the longest content
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
+        for tag, attrs in _CONTENT_SELECTORS:
+            content_element = soup.find(tag, attrs)
             if content_element:
                 # Extract text while preserving some structure
                 text = self._extract_structured_text(content_element)
@@ -293,7 +514,7 @@ class WebScraper:
             return self._clean_text(best_content)
         
         # Fallback: extract all paragraph and heading content
-        content_elements = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote', 'pre', 'code'])
+        content_elements = soup.find_all(_FALLBACK_CONTENT_TAGS)
         if content_elements:
             text_parts = []
             for element in content_elements:
@@ -322,34 +543,22 @@ class WebScraper:
     
     def _clean_text(self, text):
         """Clean and normalize extracted text while preserving structure and readability"""
-        import re
-        
-        # Remove unicode box characters and other formatting artifacts (comprehensive)
-        text = re.sub(r'[■□▪▫●○◆◇▲△▼▽★☆♦♧♢♤♠♡♣♥]', '', text)  # Basic symbols
-        text = re.sub(r'[\u2580-\u259F]', '', text)  # Block characters
-        text = re.sub(r'[\u25A0-\u25FF]', '', text)  # Geometric shapes
-        text = re.sub(r'[\u2600-\u26FF]', '', text)  # Miscellaneous symbols
-        text = re.sub(r'[\u2700-\u27BF]', '', text)  # Dingbats
-        text = re.sub(r'[\u2190-\u21FF]', '', text)  # Arrows
-        text = re.sub(r'[\u2500-\u257F]', '', text)  # Box drawing characters
-        
-        # Remove specific problematic characters
-        text = re.sub(r'[‌‍‎‏]', '', text)  # Zero-width characters
-        text = re.sub(r'[\uFEFF]', '', text)  # Byte order mark
-        text = re.sub(r'[\u200B-\u200D]', '', text)  # Zero-width spaces
+        # Remove unicode box characters, symbols and zero-width characters
+        text = _ARTIFACT_CHARS_RE.sub('', text)
         
         # Replace multiple whitespace with single space, but preserve paragraph breaks
-        text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces/tabs to single space
-        text = re.sub(r'\n[ \t]+', '\n', text)  # Remove leading whitespace on lines
-        text = re.sub(r'[ \t]+\n', '\n', text)  # Remove trailing whitespace on lines
+        text = _SPACES_RE.sub(' ', text)  # Multiple spaces/tabs to single space
+        # Every run is one space now, so line edges are plain substring replaces
+        text = text.replace('\n ', '\n')  # Remove leading whitespace on lines
+        text = text.replace(' \n', '\n')  # Remove trailing whitespace on lines
         
         # Better paragraph spacing - ensure good separation between paragraphs
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 line breaks
-        text = re.sub(r'([.!?])\s*\n([A-Z])', r'\1\n\n\2', text)  # Add paragraph breaks after sentences
+        text = _EXTRA_NEWLINES_RE.sub('\n\n', text)  # Max 2 line breaks
+        text = _SENTENCE_NEWLINE_RE.sub(r'\1\n\n\2', text)  # Add paragraph breaks after sentences
         
         # Clean up common formatting issues
-        text = re.sub(r'\s+([.!?,:;])', r'\1', text)  # Remove space before punctuation
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # Ensure space after sentence endings
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # Remove space before punctuation
+        text = _SENTENCE_SPACE_RE.sub(r'\1 \2', text)  # Ensure space after sentence endings
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -361,8 +570,16 @@ class WebScraper:
         """Extract text while preserving readable structure with better spacing"""
         text_parts = []
         
-        for child in element.descendants:
-            if child.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+        # Walk the tree, formatting each block element as a whole and not
+        # descending into it, so its text isn't added again as loose text
+        # nodes; other tags are descended into. An explicit stack avoids
+        # recursion limits on deeply nested pages
+        stack = [iter(element.children)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            elif child.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
                 text = child.get_text().strip()
                 if text:
                     text_parts.append(f"\n\n{text}\n\n")
@@ -384,38 +601,59 @@ class WebScraper:
                     text_parts.append(f"\n{text}\n\n")
             elif child.name == 'br':
                 text_parts.append("\n")
-            elif child.name is None and isinstance(child, str):
-                # Text node
-                text = child.strip()
-                if text and len(text) > 5:
-                    text_parts.append(text + " ")
+            elif child.name is None:
+                if isinstance(child, str):
+                    # Text node
+                    text = child.strip()
+                    if text and len(text) > 5:
+                        text_parts.append(text + " ")
+            else:
+                stack.append(iter(child.children))
         
         result = ''.join(text_parts)
         
         # Additional spacing improvements
-        import re
         # Ensure proper spacing around headings
-        result = re.sub(r'\n{4,}', '\n\n\n', result)  # Max 3 line breaks
+        result = _EXCESS_NEWLINES_RE.sub('\n\n\n', result)  # Max 3 line breaks
         # Add space after periods before capital letters (for better sentence flow)
-        result = re.sub(r'\.([A-Z])', r'. \1', result)
+        result = _PERIOD_CAPITAL_RE.sub(r'. \1', result)
         # Ensure list items have proper spacing
-        result = re.sub(r'(\n•[^\n]+)\n([^•\n])', r'\1\n\n\2', result)
+        result = _LIST_ITEM_END_RE.sub(r'\1\n\n\2', result)
         
         return result
 
     def batch_scrape(self, urls, delay=1):
-        """Scrape multiple URLs with delay between requests"""
-        results = []
+        """Scrape multiple URLs in parallel, waiting `delay` seconds between requests to the same host"""
+        if not urls:
+            return []
         
-        for i, url in enumerate(urls):
-            logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
-            
-            result = self.scrape_url(url)
-            if result:
-                results.append(result)
-            
-            # Add delay between requests to be respectful
-            if i < len(urls) - 1:
-                time.sleep(delay)
+        # Each page is scraped once, however often it was shared
+        urls = list(dict.fromkeys(urls))
         
-        return results
+        # Visit hosts round-robin so workers spread across sites instead of
+        # queueing behind one host's delay
+        by_host = defaultdict(list)
+        for i, url in enumerate(urls):
+            by_host[urlparse(url).netloc.lower()].append(i)
+        order = [i for i in chain.from_iterable(zip_longest(*by_host.values())) if i is not None]
+        
+        results = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=min(settings.SCRAPE_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(self.scrape_url, urls[i], delay): i for i in order}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                results[i] = future.result()
+                logger.info(f"Processed URL {done}/{len(urls)}: {urls[i]}")
+        
+        # Keep the input order
+        return [result for result in results if result]
+    
+    def _wait_for_host(self, url, min_interval):
+        """Reserve the next request slot for the URL's host and sleep until it arrives"""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_slot.get(host, 0.0))
+            self._host_next_slot[host] = slot + min_interval
+        if slot > now:
+            time.sleep(slot - now)